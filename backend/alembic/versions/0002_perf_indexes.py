@@ -0,0 +1,59 @@
+"""Composite indexes matching the hot query predicates
+
+* event(category, price_minor, created_at DESC)  – list filters + sort
+* booking(email, booked_at DESC)                 – "My bookings" page
+* booking(slot_id) WHERE status='CONFIRMED'      – capacity checks
+* slot(event_id, start_utc)                      – slot lookups per event
+* review(event_id, created_at DESC)              – review listing
+* GIN(search_vector)                             – full-text search (PG only)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0002_perf_indexes"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_cat_price_created",
+        "event",
+        ["category", "price_minor", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_booking_email_booked",
+        "booking",
+        ["email", sa.text("booked_at DESC")],
+    )
+    # Partial index: capacity checks only ever count CONFIRMED rows
+    op.create_index(
+        "ix_booking_slot_confirmed",
+        "booking",
+        ["slot_id"],
+        postgresql_where=sa.text("status = 'CONFIRMED'"),
+        sqlite_where=sa.text("status = 'CONFIRMED'"),
+    )
+    op.create_index("ix_slot_event_start", "slot", ["event_id", "start_utc"])
+    op.create_index(
+        "ix_review_event_created",
+        "review",
+        ["event_id", sa.text("created_at DESC")],
+    )
+
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("CREATE INDEX ix_event_search_vec ON event USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_event_search_vec")
+    op.drop_index("ix_review_event_created", table_name="review")
+    op.drop_index("ix_slot_event_start", table_name="slot")
+    op.drop_index("ix_booking_slot_confirmed", table_name="booking")
+    op.drop_index("ix_booking_email_booked", table_name="booking")
+    op.drop_index("ix_event_cat_price_created", table_name="event")
@@ -0,0 +1,85 @@
+"""Native UUID primary keys with server-side generation (Postgres)
+
+Converts the string id / FK columns on event, slot, booking and review
+to the native ``uuid`` type (16 bytes, faster index compares) and adds a
+``gen_random_uuid()`` server default on the primary keys so rows
+inserted outside the ORM (bulk loads, fixtures) don't need a client id.
+
+No-op on SQLite: dev/test schemas come from ``create_all`` and the
+models keep a client-side UUID default for portability.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0003_uuid_pks"
+down_revision = "0002_perf_indexes"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+# (table, fk_constraint, referred_table)
+_FOREIGN_KEYS = (
+    ("slot", "slot_event_id_fkey", "event", "event_id"),
+    ("booking", "booking_slot_id_fkey", "slot", "slot_id"),
+    ("review", "review_event_id_fkey", "event", "event_id"),
+    ("review", "review_booking_id_fkey", "booking", "booking_id"),
+)
+
+# (table, uuid columns)
+_UUID_COLUMNS = (
+    ("event", ("id",)),
+    ("slot", ("id", "event_id")),
+    ("booking", ("id", "slot_id")),
+    ("review", ("id", "event_id", "booking_id")),
+)
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgres():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    # FKs must come off before the column types can change
+    for table, constraint, _, _ in _FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_="foreignkey")
+
+    for table, columns in _UUID_COLUMNS:
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+            )
+
+    for table, _ in _UUID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+        )
+
+    for table, constraint, referred, column in _FOREIGN_KEYS:
+        op.create_foreign_key(constraint, table, referred, [column], ["id"])
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        return
+
+    for table, constraint, _, _ in _FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_="foreignkey")
+
+    for table, _ in _UUID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+    for table, columns in _UUID_COLUMNS:
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar USING {column}::text"
+            )
+
+    for table, constraint, referred, column in _FOREIGN_KEYS:
+        op.create_foreign_key(constraint, table, referred, [column], ["id"])
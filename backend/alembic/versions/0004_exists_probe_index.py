@@ -0,0 +1,28 @@
+"""Covering index for booking existence probes
+
+``booking_exists`` filters on (slot_id, email, status) with LIMIT 1; a
+composite index covering all three columns lets the planner answer it
+with an index-only probe that stops at the first match.  Review probes
+ride the existing ``review.booking_id`` index.
+"""
+
+from alembic import op
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0004_exists_probe_index"
+down_revision = "0003_uuid_pks"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_booking_slot_email_status",
+        "booking",
+        ["slot_id", "email", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_booking_slot_email_status", table_name="booking")
@@ -0,0 +1,33 @@
+"""Server-side NOW() defaults on timestamp columns
+
+Lets non-ORM inserts (bulk executemany, fixtures, manual SQL) omit the
+timestamp and have the database stamp it — one clock, no skew between
+app hosts.  ORM construction keeps its client-side default.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0005_ts_server_defaults"
+down_revision = "0004_exists_probe_index"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+_COLUMNS = (
+    ("event", "created_at"),
+    ("slot", "created_at"),
+    ("booking", "booked_at"),
+    ("review", "created_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,49 @@
+"""Materialized view for the popularity sort (Postgres)
+
+``list_events``' popularity branch aggregated 30 days of bookings on
+every page load.  This snapshots that aggregate into
+``event_popularity_30d`` so the sort becomes an index-backed join; a
+Celery beat task refreshes it every few minutes (CONCURRENTLY, which
+needs the unique index).
+
+No-op on SQLite: dev/test keeps the live subquery fallback.
+"""
+
+from alembic import op
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0006_popularity_mv"
+down_revision = "0005_ts_server_defaults"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgres():
+        return
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW event_popularity_30d AS
+        SELECT s.event_id, COUNT(*) AS pop
+        FROM booking b
+        JOIN slot s ON s.id = b.slot_id
+        WHERE b.booked_at >= now() - interval '30 days'
+          AND b.status = 'CONFIRMED'
+        GROUP BY s.event_id
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_event_popularity_30d_event"
+        " ON event_popularity_30d (event_id)"
+    )
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS event_popularity_30d")
@@ -0,0 +1,58 @@
+"""Align sort indexes with the keyset cursor keys
+
+The cursor-paginated lists order by ``(timestamp DESC, id DESC)`` so a
+page seek can ride a single index range scan; the 0002 indexes stop at
+the timestamp, forcing a sort step for the id tie-break.  Rebuild them
+with the id column appended, and add one for the default "recent"
+events sort which previously had no dedicated index at all.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0007_keyset_indexes"
+down_revision = "0006_popularity_mv"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    op.drop_index("ix_booking_email_booked", table_name="booking")
+    op.create_index(
+        "ix_booking_email_booked",
+        "booking",
+        ["email", sa.text("booked_at DESC"), sa.text("id DESC")],
+    )
+
+    op.drop_index("ix_review_event_created", table_name="review")
+    op.create_index(
+        "ix_review_event_created",
+        "review",
+        ["event_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+    op.create_index(
+        "ix_event_created_id",
+        "event",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_created_id", table_name="event")
+
+    op.drop_index("ix_review_event_created", table_name="review")
+    op.create_index(
+        "ix_review_event_created",
+        "review",
+        ["event_id", sa.text("created_at DESC")],
+    )
+
+    op.drop_index("ix_booking_email_booked", table_name="booking")
+    op.create_index(
+        "ix_booking_email_booked",
+        "booking",
+        ["email", sa.text("booked_at DESC")],
+    )
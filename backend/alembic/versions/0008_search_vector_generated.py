@@ -0,0 +1,42 @@
+"""Rewrite search_vector as a generated column behind the GIN index
+
+The column existed but nothing ever populated it, so full-text
+predicates always fell back to a seq scan.  Recreate it as a Postgres
+``GENERATED ALWAYS AS (to_tsvector(…)) STORED`` column — always fresh,
+no triggers — and rebuild the GIN index on top (dropping the column
+drops it).  Any btree on the column is removed: a btree can't serve
+``@@`` queries.  No-op on SQLite, which searches via LIKE.
+"""
+
+from alembic import op
+
+from app.models.event import SEARCH_VECTOR_EXPR
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0008_search_vector_gen"
+down_revision = "0007_keyset_indexes"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_event_search_vec")
+    op.execute("DROP INDEX IF EXISTS ix_event_search_vector")  # stray btree
+    op.drop_column("event", "search_vector")
+    op.execute(
+        "ALTER TABLE event ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPR}) STORED"
+    )
+    op.execute("CREATE INDEX ix_event_search_vec ON event USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_event_search_vec")
+    op.drop_column("event", "search_vector")
+    op.execute("ALTER TABLE event ADD COLUMN search_vector tsvector")
+    op.execute("CREATE INDEX ix_event_search_vec ON event USING GIN (search_vector)")
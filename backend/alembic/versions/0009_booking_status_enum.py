@@ -0,0 +1,37 @@
+"""Store Booking.status as a native booking_status enum
+
+The two-value status was a free-form VARCHAR: ~10 bytes plus varlena
+header per row and a strcmp per predicate.  A native Postgres ENUM is a
+fixed 4 bytes compared as an integer, so rows get narrower and the
+CONFIRMED filters cheaper.  Every row already carries a value, so the
+column also becomes NOT NULL.  SQLite keeps VARCHAR (create_all adds
+the CHECK for fresh dev DBs) — no-op here.
+"""
+
+from alembic import op
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0009_booking_status_enum"
+down_revision = "0008_search_vector_gen"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("CREATE TYPE booking_status AS ENUM ('CONFIRMED', 'CANCELLED')")
+    op.execute(
+        "ALTER TABLE booking ALTER COLUMN status TYPE booking_status "
+        "USING status::booking_status"
+    )
+    op.execute("ALTER TABLE booking ALTER COLUMN status SET NOT NULL")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE booking ALTER COLUMN status DROP NOT NULL")
+    op.execute("ALTER TABLE booking ALTER COLUMN status TYPE varchar USING status::text")
+    op.execute("DROP TYPE booking_status")
@@ -0,0 +1,33 @@
+"""Add the denormalised Slot.booked_count seat counter
+
+Capacity checks used to COUNT booking rows on every POST; the counter
+is now incremented/decremented transactionally with each booking and a
+conditional ``UPDATE … WHERE booked_count < max_bookings`` doubles as
+the capacity gate.  Backfilled here from the live CONFIRMED counts.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0010_slot_booked_count"
+down_revision = "0009_booking_status_enum"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    op.add_column(
+        "slot",
+        sa.Column("booked_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE slot SET booked_count = ("
+        "SELECT count(*) FROM booking b "
+        "WHERE b.slot_id = slot.id AND b.status = 'CONFIRMED')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("slot", "booked_count")
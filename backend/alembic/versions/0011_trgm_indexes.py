@@ -0,0 +1,36 @@
+"""Trigram GIN indexes for substring/typo search on title and host
+
+The tsvector GIN only matches whole lexemes, so single-word prefixes
+and misspellings ("desi" for "Design") fell back to a seq scan.
+pg_trgm indexes 3-char substrings, making ``ILIKE '%q%'`` on title /
+host_name index-backed.  The query builder routes one-word searches
+here and keeps full-text for multi-word queries.  Postgres only.
+"""
+
+from alembic import op
+
+# ——— revision identifiers ———————————————————————————————
+revision = "0011_trgm_indexes"
+down_revision = "0010_slot_booked_count"
+branch_labels = None
+depends_on = None
+# ————————————————————————————————————————————————————————————
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_event_title_trgm ON event USING gin (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_event_host_trgm ON event USING gin (host_name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_event_host_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_event_title_trgm")
@@ -8,7 +8,7 @@ same boilerplate over and over.
 * ``db_session``      – SQLModel session (transaction scope)
 * ``current_email``   – Optional e-mail extracted from header *or* query
 * ``required_email``  – Same but raises 400 if missing
-* ``pagination``      – Validated (page, size) tuple
+* ``pagination``      – Validated :class:`PageParams` (page / size / cursor)
 
 Usage
 -----
@@ -17,24 +17,27 @@ Usage
 
 from __future__ import annotations
 
-from typing import Generator, Tuple
+import base64
+import functools
+from datetime import datetime
+from typing import AsyncGenerator, NamedTuple, Optional, Tuple
 
 from fastapi import Depends, Header, HTTPException, Query, status
-from pydantic import EmailStr
-from sqlmodel import Session
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import get_async_session
 
 # ————————————————————————————————————————————————————————————————
 # Database session
 # ————————————————————————————————————————————————————————————————
 
 
-def db_session() -> Generator[Session, None, None]:
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Yields a SQLModel Session inside a transaction scope.
+    Yields a SQLModel AsyncSession inside a transaction scope.
     """
-    with get_session() as session:
+    async with get_async_session() as session:
         yield session
 
 
@@ -42,6 +45,38 @@ def db_session() -> Generator[Session, None, None]:
 # Lightweight “identity” (e-mail) helpers
 # ————————————————————————————————————————————————————————————————
 
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+
+@functools.lru_cache(maxsize=4096)
+def _valid_email(raw: str) -> str:
+    """
+    Validate an address once per distinct string.
+
+    The same visitor e-mail arrives on every request, so the LRU skips
+    the regex/IDNA work on repeats (failures are not cached by
+    ``lru_cache``, so garbage is still rejected every time).
+    """
+    return _EMAIL_ADAPTER.validate_python(raw)
+
+
+def _email_or_400(raw: str) -> str:
+    try:
+        return _valid_email(raw)
+    except ValidationError:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail="Invalid e-mail address.",
+        )
+
+
+def path_email(email: str) -> str:
+    """
+    Validates an ``{email}`` path parameter (cached) – use as a dependency
+    so routes don't re-validate at both the path and service layer.
+    """
+    return _email_or_400(email)
+
 
 def current_email(
     x_user_email: str | None = Header(
@@ -62,7 +97,7 @@ def current_email(
     ``required_email`` instead.
     """
     email_value = x_user_email or email_query
-    return EmailStr(email_value) if email_value else None
+    return _email_or_400(email_value) if email_value else None
 
 
 def required_email(email: EmailStr | None = Depends(current_email)) -> EmailStr:
@@ -84,17 +119,61 @@ def required_email(email: EmailStr | None = Depends(current_email)) -> EmailStr:
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
+# Keyset cursor = (created_at / booked_at of the last row, its id), encoded
+# as an opaque urlsafe-base64 token so clients just echo X-Cursor back.
+CursorKey = Tuple[datetime, str]
+
+
+def encode_cursor(ts: datetime, row_id: str) -> str:
+    """Serialise a keyset position into an opaque URL-safe token."""
+    raw = f"{ts.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> CursorKey:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` on garbage."""
+    padded = value + "=" * (-len(value) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    ts_str, _, row_id = raw.partition("|")
+    if not row_id:
+        raise ValueError("malformed cursor")
+    return datetime.fromisoformat(ts_str), row_id
+
+
+class PageParams(NamedTuple):
+    page: int
+    size: int
+    cursor: Optional[CursorKey]
+    with_total: bool
+
 
 def pagination(
-    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page: int = Query(1, ge=1, description="Page number (starts at 1; ignored when cursor is set)"),
     size: int = Query(
         DEFAULT_PAGE_SIZE,
         ge=1,
         le=MAX_PAGE_SIZE,
         description=f"Items per page (max {MAX_PAGE_SIZE})",
     ),
-) -> Tuple[int, int]:
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from the previous response's X-Cursor header",
+    ),
+    with_total: bool = Query(
+        False,
+        description="Compute X-Total (adds an aggregate; off by default)",
+    ),
+) -> PageParams:
     """
-    Returns validated ``(page, size)`` tuple.
+    Returns validated :class:`PageParams`.
+
+    ``cursor`` (keyset) takes precedence over ``page`` (legacy offset); the
+    total count is only computed when explicitly requested.
     """
-    return page, size
+    key: Optional[CursorKey] = None
+    if cursor is not None:
+        try:
+            key = decode_cursor(cursor)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Malformed cursor")
+    return PageParams(page, size, key, with_total)
@@ -12,13 +12,17 @@ PATCH  /bookings/{id}                – cancel booking
 GET    /bookings/{id}/ics            – download iCalendar file
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from fastapi.responses import StreamingResponse
-from sqlmodel import Session
-
-from app.api.deps import db_session, required_email, pagination
-from app.crud import get_booking as crud_get_booking
-from app.models.slot import Slot
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import PageParams, db_session, encode_cursor, pagination, path_email
+from app.core.cache import invalidate_event
+from app.crud import (
+    get_booking as crud_get_booking,
+    get_slot_for_event as crud_get_slot_for_event,
+)
 from app.schemas import (
     BookingCreate,
     BookingRead,
@@ -29,10 +33,14 @@ from app.services.bookings import (
     user_bookings as svc_user_bookings,
     cancel_booking as svc_cancel_booking,
 )
-from app.services.calendar import generate_ics_bytes
+from app.services.calendar import generate_ics_bytes, ics_content_hash
 
 router = APIRouter(prefix="", tags=["bookings"])
 
+# Module-level singleton: one batched pydantic-core call per list response
+# instead of a per-row `from_orm` in Python.
+_BOOKING_LIST_ADAPTER = TypeAdapter(list[BookingRead])
+
 # ----------------------------------------------------------------------------
 # CREATE under /events/{event_id}/bookings
 # ----------------------------------------------------------------------------
@@ -43,23 +51,33 @@ router = APIRouter(prefix="", tags=["bookings"])
     response_model=BookingRead,
     status_code=status.HTTP_201_CREATED,
 )
-def create_booking(
+async def create_booking(
     event_id: str,
     payload: BookingCreate,
-    session: Session = Depends(db_session),
+    bg: BackgroundTasks,
+    session: AsyncSession = Depends(db_session),
 ):
-    # Validate slot belongs to event
-    slot: Slot | None = session.get(Slot, payload.slot_id)
-    if slot is None or slot.event_id != event_id:
+    # Validate slot belongs to event (capacity is enforced atomically in
+    # make_booking via the booked_count conditional increment)
+    slot = await crud_get_slot_for_event(session, payload.slot_id, event_id)
+    if slot is None:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Invalid slot for event")
 
-    booking = make_booking(
+    # Side-effects (Redis publish, e-mail enqueue) run after the response
+    booking = await make_booking(
         session,
         slot=slot,
         name=payload.name,
         email=payload.email,
+        bg=bg,
+    )
+    # Seat counts changed → retire cached event detail/list payloads
+    await invalidate_event(event_id)
+    return Response(
+        BookingRead.model_validate(booking).model_dump_json(),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
     )
-    return BookingRead.from_orm(booking)
 
 
 # ----------------------------------------------------------------------------
@@ -68,16 +86,26 @@ def create_booking(
 
 
 @router.get("/users/{email}/bookings", response_model=list[BookingRead])
-def my_bookings(
-    email: str,
-    page_info: tuple[int, int] = Depends(pagination),
-    session: Session = Depends(db_session),
+async def my_bookings(
+    email: str = Depends(path_email),
+    page_info: PageParams = Depends(pagination),
+    session: AsyncSession = Depends(db_session),
 ):
-    page, size = page_info
-    bookings, total = svc_user_bookings(session, email=email, page=page, size=size)
-    response = Response()
-    response.headers["X-Total"] = str(total)
-    return [BookingRead.from_orm(b) for b in bookings]
+    bookings, next_key, total = await svc_user_bookings(
+        session,
+        email=email,
+        page=page_info.page,
+        size=page_info.size,
+        cursor=page_info.cursor,
+        with_total=page_info.with_total,
+    )
+    headers = {}
+    if next_key is not None:
+        headers["X-Cursor"] = encode_cursor(*next_key)
+    if total is not None:
+        headers["X-Total"] = str(total)
+    rows = _BOOKING_LIST_ADAPTER.validate_python(bookings, from_attributes=True)
+    return ORJSONResponse(_BOOKING_LIST_ADAPTER.dump_python(rows), headers=headers)
 
 
 # ----------------------------------------------------------------------------
@@ -86,11 +114,16 @@ def my_bookings(
 
 
 @router.get("/bookings/{booking_id}", response_model=BookingRead)
-def get_booking(booking_id: str, session: Session = Depends(db_session)):
-    booking = crud_get_booking(session, booking_id)
+async def get_booking(booking_id: str, session: AsyncSession = Depends(db_session)):
+    booking = await crud_get_booking(session, booking_id)
     if not booking:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Booking not found")
-    return BookingRead.from_orm(booking)
+    # Serialize once in pydantic-core; returning a Response skips
+    # FastAPI's second response_model validation pass.
+    return Response(
+        BookingRead.model_validate(booking).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -99,20 +132,23 @@ def get_booking(booking_id: str, session: Session = Depends(db_session)):
 
 
 @router.patch("/bookings/{booking_id}", response_model=BookingRead)
-def cancel_booking_endpoint(
+async def cancel_booking_endpoint(
     booking_id: str,
     payload: BookingUpdate,
-    session: Session = Depends(db_session),
+    bg: BackgroundTasks,
+    session: AsyncSession = Depends(db_session),
 ):
     if payload.status != "CANCELLED":
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Only cancellation supported")
 
-    booking = crud_get_booking(session, booking_id)
-    if not booking:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Booking not found")
-
-    updated = svc_cancel_booking(session, booking=booking)
-    return BookingRead.from_orm(updated)
+    # No pre-fetch: the service does one atomic UPDATE … RETURNING and
+    # raises 404/400 itself when nothing matched.
+    updated = await svc_cancel_booking(session, booking_id=booking_id, bg=bg)
+    await invalidate_event(updated.slot.event_id)
+    return Response(
+        BookingRead.model_validate(updated).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -120,16 +156,35 @@ def cancel_booking_endpoint(
 # ----------------------------------------------------------------------------
 
 
+# ICS payloads are ~1 KB and only change on cancel or an event edit, so
+# generate once per (booking, status, content hash) and serve from memory
+# afterwards — the hash component keeps a PATCHed event from pinning the
+# pre-edit file in each worker process.
+_ICS_CACHE_MAX = 1024
+_ics_cache: dict[tuple[str, str, str], bytes] = {}
+
+
 @router.get("/bookings/{booking_id}/ics")
-def download_ics(booking_id: str, session: Session = Depends(db_session)):
-    booking = crud_get_booking(session, booking_id)
+async def download_ics(booking_id: str, session: AsyncSession = Depends(db_session)):
+    booking = await crud_get_booking(session, booking_id)
     if not booking:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
-    ics_bytes = generate_ics_bytes(booking)
-    filename = f"{booking_id}.ics"
-    return StreamingResponse(
-        ics_bytes,
+    cache_key = (booking_id, str(booking.status), ics_content_hash(booking))
+    ics = _ics_cache.get(cache_key)
+    if ics is None:
+        if len(_ics_cache) >= _ICS_CACHE_MAX:
+            _ics_cache.clear()
+        ics = _ics_cache[cache_key] = generate_ics_bytes(booking)
+
+    # Tiny fixed payload → plain Response with Content-Length beats
+    # chunked transfer (no framing overhead, one fewer copy).
+    return Response(
+        content=ics,
         media_type="text/calendar",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers={
+            "Content-Disposition": f'attachment; filename="{booking_id}.ics"',
+            "Content-Length": str(len(ics)),
+            "Cache-Control": "private, max-age=300",
+        },
     )
@@ -13,13 +13,18 @@ DELETE /events/{id}            – delete event (optional, here for completeness
 POST   /events/{id}/image-url  – presign S3 upload URL for branding image
 """
 
+import hashlib
 from datetime import datetime
 from typing import List
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
-from sqlmodel import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import db_session, pagination
+from app.api.deps import db_session, decode_cursor, encode_cursor, pagination
+from app.core.cache import cache_get, cache_set, invalidate_event, list_generation
 from app.crud import (
     create_event as crud_create_event,
     delete_event as crud_delete_event,
@@ -44,6 +49,9 @@ except ImportError:  # pragma: no cover – storage layer may come later
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Batched card serialization – one pydantic-core call for the whole page
+_EVENT_CARD_LIST_ADAPTER = TypeAdapter(List[EventCard])
+
 
 # ----------------------------------------------------------------------------
 # LIST
@@ -51,14 +59,50 @@ router = APIRouter(prefix="/events", tags=["events"])
 
 
 @router.get("/", response_model=List[EventCard])
-def list_events(
+async def list_events(
     filters: EventFilter = Depends(),
-    response: Response = None,  # type: ignore
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
+    if_none_match: str | None = Header(default=None),
 ):
     """Public listing with search, category & price filters."""
 
-    events, total = crud_list_events(
+    cursor_key = None
+    if filters.cursor is not None:
+        try:
+            cursor_key = decode_cursor(filters.cursor)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Malformed cursor")
+
+    # Cache key = generation counter + hash of the full filter set; any
+    # event/booking mutation bumps the generation, retiring all pages.
+    # A None generation (Redis down) disables both the cache and the
+    # ETag below — without the counter nothing can validate freshness.
+    generation = await list_generation()
+    filters_hash = hashlib.blake2b(
+        orjson.dumps(filters.model_dump()), digest_size=8
+    ).hexdigest()
+
+    # The generation counter doubles as a change validator: the same
+    # (generation, filters) pair always yields the same page, so polling
+    # clients that echo the ETag get a bodyless 304 — no Redis payload
+    # read, no SQL, no serialization.
+    etag = None
+    if generation is not None:
+        etag = f'W/"{generation}-{filters_hash}"'
+        if if_none_match == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        cached = await cache_get(f"events:list:{generation}:{filters_hash}")
+        if cached is not None:
+            envelope = orjson.loads(cached)
+            headers = {"ETag": etag}
+            if envelope["cursor"] is not None:
+                headers["X-Cursor"] = envelope["cursor"]
+            if envelope["total"] is not None:
+                headers["X-Total"] = envelope["total"]
+            return ORJSONResponse(envelope["body"], headers=headers)
+
+    rows, next_key, total = await crud_list_events(
         session,
         page=filters.page,
         size=filters.size,
@@ -67,13 +111,37 @@ def list_events(
         price_min=filters.price_min,
         price_max=filters.price_max,
         sort=filters.sort.value if hasattr(filters.sort, "value") else filters.sort,
+        cursor=cursor_key,
+        with_total=filters.with_total,
     )
 
-    # Expose total count in headers (front‑end uses X-Total)
-    if response is not None:
-        response.headers["X-Total"] = str(total)
-
-    return [EventCard.from_orm(e) for e in events]
+    # X-Cursor / X-Total ride on the response (front-end pagination reads them)
+    headers = {"ETag": etag} if etag is not None else {}
+    if next_key is not None:
+        headers["X-Cursor"] = encode_cursor(*next_key)
+    if total is not None:
+        headers["X-Total"] = str(total)
+
+    # remaining_slots arrives pre-aggregated from SQL (no lazy loads here)
+    cards = _EVENT_CARD_LIST_ADAPTER.validate_python(
+        [
+            {**event.model_dump(exclude={"search_vector"}), "remaining_slots": remaining}
+            for event, remaining in rows
+        ]
+    )
+    body = _EVENT_CARD_LIST_ADAPTER.dump_python(cards)
+    if generation is not None:
+        await cache_set(
+            f"events:list:{generation}:{filters_hash}",
+            orjson.dumps(
+                {
+                    "body": body,
+                    "cursor": headers.get("X-Cursor"),
+                    "total": headers.get("X-Total"),
+                }
+            ),
+        )
+    return ORJSONResponse(body, headers=headers)
 
 
 # ----------------------------------------------------------------------------
@@ -82,11 +150,18 @@ def list_events(
 
 
 @router.get("/{event_id}", response_model=EventDetail)
-def get_event(event_id: str, session: Session = Depends(db_session)):
-    event = crud_get_event(session, event_id)
+async def get_event(event_id: str, session: AsyncSession = Depends(db_session)):
+    cache_key = f"event:{event_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
+    event = await crud_get_event(session, event_id)
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Event not found")
-    return EventDetail.from_orm(event)
+    payload = EventDetail.model_validate(event).model_dump_json()
+    await cache_set(cache_key, payload)
+    return Response(payload, media_type="application/json")
 
 
 # ----------------------------------------------------------------------------
@@ -95,12 +170,17 @@ def get_event(event_id: str, session: Session = Depends(db_session)):
 
 
 @router.post("/", response_model=EventDetail, status_code=status.HTTP_201_CREATED)
-def create_event(
+async def create_event(
     payload: EventCreate,
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
 ):
-    event = crud_create_event(session, **payload.dict(exclude={"slots"}), slots=payload.slots)
-    return EventDetail.from_orm(event)
+    event = await crud_create_event(
+        session,
+        **payload.model_dump(exclude={"slots"}),
+        slots=[s.model_dump() for s in payload.slots],
+    )
+    await invalidate_event(event.id)
+    return EventDetail.model_validate(event)
 
 
 # ----------------------------------------------------------------------------
@@ -109,17 +189,18 @@ def create_event(
 
 
 @router.patch("/{event_id}", response_model=EventDetail)
-def update_event(
+async def update_event(
     event_id: str,
     payload: EventUpdate,
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
 ):
-    event = crud_get_event(session, event_id)
+    event = await crud_get_event(session, event_id)
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    event = crud_update_event(session, event, **payload.dict(exclude_none=True))
-    return EventDetail.from_orm(event)
+    event = await crud_update_event(session, event, **payload.model_dump(exclude_none=True))
+    await invalidate_event(event.id)
+    return EventDetail.model_validate(event)
 
 
 # ----------------------------------------------------------------------------
@@ -128,11 +209,12 @@ def update_event(
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(event_id: str, session: Session = Depends(db_session)):
-    event = crud_get_event(session, event_id)
+async def delete_event(event_id: str, session: AsyncSession = Depends(db_session)):
+    event = await crud_get_event(session, event_id)
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Event not found")
-    crud_delete_event(session, event)
+    await crud_delete_event(session, event)
+    await invalidate_event(event_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -142,9 +224,9 @@ def delete_event(event_id: str, session: Session = Depends(db_session)):
 
 
 @router.post("/{event_id}/image-url")
-def get_image_upload_url(
+async def get_image_upload_url(
     event_id: str,
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
 ):
     """Returns presigned PUT URL + public GET URL for branding image."""
 
@@ -154,7 +236,7 @@ def get_image_upload_url(
             detail="Presign service not configured",
         )
 
-    event = crud_get_event(session, event_id)
+    event = await crud_get_event(session, event_id)
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Event not found")
 
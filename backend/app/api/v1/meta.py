@@ -4,11 +4,19 @@ from __future__ import annotations
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 * `/categories` → returns canonical list of event categories
 * `/fx`         → returns cached FX rates dict
+
+Both payloads are effectively static between refreshes, so they are
+pre-serialised once and served with `Cache-Control`/`ETag` headers; a
+matching `If-None-Match` short-circuits to an empty 304.
 """
 
+import hashlib
+import time
 from datetime import datetime, timezone
+from email.utils import formatdate
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Header, Response
 
 from app.models.category_enum import CategoryEnum
 from app.services.fx import get_rates
@@ -16,28 +24,82 @@ from app.services.fx import get_rates
 router = APIRouter(prefix="", tags=["meta"])
 
 
+def _etag(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 # ---------------------------------------------------------------------------
-# /categories – dropdown helper
+# /categories – dropdown helper (constant → serialised once at import)
 # ---------------------------------------------------------------------------
 
+_CATEGORIES_JSON: bytes = orjson.dumps(CategoryEnum.list())
+_CATEGORIES_ETAG: str = _etag(_CATEGORIES_JSON)
+
 
 @router.get("/categories", response_model=list[str])
-def categories():
+async def categories(if_none_match: str | None = Header(None)):
     """Return all available category strings."""
-    return CategoryEnum.list()
+    if if_none_match == _CATEGORIES_ETAG:
+        return Response(status_code=304)
+    return Response(
+        content=_CATEGORIES_JSON,
+        media_type="application/json",
+        headers={
+            "Cache-Control": "public, max-age=86400",
+            "ETag": _CATEGORIES_ETAG,
+        },
+    )
 
 
 # ---------------------------------------------------------------------------
-# /fx – cached foreign‑exchange rates
+# /fx – cached foreign‑exchange rates (60 s in-process cache over Redis)
 # ---------------------------------------------------------------------------
 
+_FX_TTL_SECONDS = 60
+
+# (expires_at_monotonic, rates_etag, payload_bytes, etag, last_modified_http_date)
+_fx_cache: tuple[float, str, bytes, str, str] | None = None
+
 
 @router.get("/fx")
-def fx_rates():
+def fx_rates(if_none_match: str | None = Header(None)):
     """Return cached FX rate map with timestamp."""
-    rates = get_rates()
-    return {
-        "base": "USD",
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-        "rates": rates,
-    }
+    global _fx_cache
+
+    now = time.monotonic()
+    if _fx_cache is None or _fx_cache[0] <= now:
+        rates = get_rates()
+        # The timestamp marks the *rates* refresh, not this cache refill:
+        # if the rates haven't changed, keep the previous body byte-for-byte
+        # so its ETag stays valid and repeat callers still get 304s.
+        rates_etag = _etag(orjson.dumps(rates))
+        if _fx_cache is not None and _fx_cache[1] == rates_etag:
+            _fx_cache = (now + _FX_TTL_SECONDS, *_fx_cache[1:])
+        else:
+            payload = orjson.dumps(
+                {
+                    "base": "USD",
+                    "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                    "rates": rates,
+                }
+            )
+            _fx_cache = (
+                now + _FX_TTL_SECONDS,
+                rates_etag,
+                payload,
+                _etag(payload),
+                formatdate(usegmt=True),
+            )
+
+    _, _, payload, etag, last_modified = _fx_cache
+    if if_none_match == etag:
+        return Response(status_code=304)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={
+            "Cache-Control": f"public, max-age={_FX_TTL_SECONDS}",
+            "ETag": etag,
+            "Last-Modified": last_modified,
+        },
+    )
@@ -3,9 +3,11 @@ from __future__ import annotations
 """api/v1/reviews.py – Router for Review endpoints"""
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlmodel import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import db_session, pagination
+from app.api.deps import PageParams, db_session, encode_cursor, pagination
 from app.crud import get_booking as crud_get_booking
 from app.crud import get_review as crud_get_review
 from app.schemas import ReviewCreate, ReviewRead, ReviewUpdate
@@ -18,6 +20,9 @@ from app.services.review import (
 
 router = APIRouter(prefix="", tags=["reviews"])
 
+# Batched list serialization – one pydantic-core call instead of per-row from_orm
+_REVIEW_LIST_ADAPTER = TypeAdapter(list[ReviewRead])
+
 # ---------------------------------------------------------------------------
 # CREATE  /events/{event_id}/reviews
 # ---------------------------------------------------------------------------
@@ -27,23 +32,23 @@ router = APIRouter(prefix="", tags=["reviews"])
     response_model=ReviewRead,
     status_code=status.HTTP_201_CREATED,
 )
-def create_review(
+async def create_review(
     event_id: str,
     payload: ReviewCreate,
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
 ):
     # 1. ensure booking exists
-    booking = crud_get_booking(session, payload.booking_id)
+    booking = await crud_get_booking(session, payload.booking_id)
     if booking is None or booking.slot.event_id != event_id:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Invalid booking for event")
 
-    review = add_review(
+    review = await add_review(
         session,
         booking=booking,
         rating=payload.rating,
         comment=payload.comment,
     )
-    return ReviewRead.from_orm(review)
+    return ReviewRead.model_validate(review)
 
 
 # ---------------------------------------------------------------------------
@@ -51,17 +56,26 @@ def create_review(
 # ---------------------------------------------------------------------------
 
 @router.get("/events/{event_id}/reviews", response_model=list[ReviewRead])
-def list_event_reviews(
+async def list_event_reviews(
     event_id: str,
-    page_info: tuple[int, int] = Depends(pagination),
-    response: Response | None = None,  # type: ignore[valid-type]
-    session: Session = Depends(db_session),
+    page_info: PageParams = Depends(pagination),
+    session: AsyncSession = Depends(db_session),
 ):
-    page, size = page_info
-    reviews, total = event_reviews(session, event_id=event_id, page=page, size=size)
-    if response is not None:
-        response.headers["X-Total"] = str(total)
-    return [ReviewRead.from_orm(r) for r in reviews]
+    reviews, next_key, total = await event_reviews(
+        session,
+        event_id=event_id,
+        page=page_info.page,
+        size=page_info.size,
+        cursor=page_info.cursor,
+        with_total=page_info.with_total,
+    )
+    headers = {}
+    if next_key is not None:
+        headers["X-Cursor"] = encode_cursor(*next_key)
+    if total is not None:
+        headers["X-Total"] = str(total)
+    rows = _REVIEW_LIST_ADAPTER.validate_python(reviews, from_attributes=True)
+    return ORJSONResponse(_REVIEW_LIST_ADAPTER.dump_python(rows), headers=headers)
 
 
 # ---------------------------------------------------------------------------
@@ -69,22 +83,22 @@ def list_event_reviews(
 # ---------------------------------------------------------------------------
 
 @router.patch("/reviews/{review_id}", response_model=ReviewRead)
-def update_review(
+async def update_review(
     review_id: str,
     payload: ReviewUpdate,
-    session: Session = Depends(db_session),
+    session: AsyncSession = Depends(db_session),
 ):
-    review = crud_get_review(session, review_id)
+    review = await crud_get_review(session, review_id)
     if review is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Review not found")
 
-    updated = edit_review(
+    updated = await edit_review(
         session,
         review=review,
         rating=payload.rating,
         comment=payload.comment,
     )
-    return ReviewRead.from_orm(updated)
+    return ReviewRead.model_validate(updated)
 
 
 # ---------------------------------------------------------------------------
@@ -92,10 +106,10 @@ def update_review(
 # ---------------------------------------------------------------------------
 
 @router.delete("/reviews/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_review(review_id: str, session: Session = Depends(db_session)):
-    review = crud_get_review(session, review_id)
+async def delete_review(review_id: str, session: AsyncSession = Depends(db_session)):
+    review = await crud_get_review(session, review_id)
     if review is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Review not found")
 
-    remove_review(session, review=review)
+    await remove_review(session, review=review)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
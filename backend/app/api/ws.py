@@ -8,6 +8,13 @@ from __future__ import annotations
 * 3️⃣  Whenever `services.bookings._broadcast_slot_update()` publishes JSON,
        the server forwards it to all connected browsers.
 
+Fan-out
+-------
+A single process-wide :class:`_Hub` holds ONE Redis subscription per channel
+and multiplexes each message into a bounded ``asyncio.Queue`` per connected
+WebSocket.  N viewers of the same event therefore cost one Redis
+subscription and one message decode, not N.
+
 Protocol (client ↔ server)
 --------------------------
 • **Send**: nothing (one‑way push)
@@ -20,19 +27,12 @@ message arrives.
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import Any, Dict, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.core.config import settings
-
-# redis.asyncio is available in redis-py >=4.2
-try:
-    from redis.asyncio import Redis  # type: ignore
-except ImportError as exc:  # pragma: no cover
-    raise RuntimeError(
-        "redis-py >=4.2 required for async WebSocket support – install `redis` package"
-    ) from exc
+# Shared process-wide async client (pool options live in core.redis)
+from app.core.redis import redis_async
 
 log = logging.getLogger(__name__)
 
@@ -40,18 +40,84 @@ router = APIRouter()
 
 
 # ----------------------------------------------------------------------------
-# Helper: get (cached) Redis connection
+# Pubsub fan-out hub (one Redis subscription per channel, process-wide)
 # ----------------------------------------------------------------------------
 
-
-_redis: Redis | None = None
+# Slow-consumer protection: a socket that stops reading loses its *oldest*
+# queued updates rather than stalling the reader for everyone else.
+_QUEUE_MAXSIZE = 64
+
+
+class _Hub:
+    """Multiplexes Redis pubsub channels onto per-WebSocket queues.
+
+    One background reader task polls a single ``pubsub`` connection for all
+    channels; each message is decoded once and fanned out to every queue
+    registered for its channel.
+    """
+
+    def __init__(self) -> None:
+        self._channels: Dict[str, Set[asyncio.Queue]] = {}
+        self._pubsub: Any = None
+        self._reader_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        """Register a new listener; starts the reader on first use."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = redis_async.pubsub()
+            if channel not in self._channels:
+                self._channels[channel] = set()
+                await self._pubsub.subscribe(channel)
+                log.debug("Hub subscribed to %s", channel)
+            self._channels[channel].add(queue)
+            if self._reader_task is None or self._reader_task.done():
+                self._reader_task = asyncio.create_task(self._reader())
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """Drop a listener; unsubscribes the channel when it empties."""
+        async with self._lock:
+            listeners = self._channels.get(channel)
+            if listeners is None:
+                return
+            listeners.discard(queue)
+            if not listeners:
+                del self._channels[channel]
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except Exception:  # pragma: no cover
+                    pass
+                log.debug("Hub unsubscribed from %s", channel)
+
+    async def _reader(self) -> None:
+        """Single poll loop shared by every connected WebSocket."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+            except Exception:  # pragma: no cover – Redis hiccup, retry
+                log.exception("Hub reader error; retrying")
+                await asyncio.sleep(1.0)
+                continue
+            if message is None:
+                continue
+            payload = message["data"]
+            # Ensure JSON string – redis-py may already give str
+            if not isinstance(payload, str):
+                payload = json.dumps(payload)
+            for queue in tuple(self._channels.get(message["channel"], ())):
+                if queue.full():
+                    queue.get_nowait()  # drop oldest for slow consumers
+                queue.put_nowait(payload)
 
 
-def _get_redis() -> Redis:
-    global _redis
-    if _redis is None:
-        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
-    return _redis
+hub = _Hub()
 
 
 # ----------------------------------------------------------------------------
@@ -59,52 +125,54 @@ def _get_redis() -> Redis:
 # ----------------------------------------------------------------------------
 
 
+# If neither the client nor Redis produces anything within this window we
+# send a heartbeat (keeps Heroku / nginx happy); no separate ping task.
+_POLL_TIMEOUT_SECONDS = 25.0
+
+
 @router.websocket("/events/{event_id}/updates")
 async def event_updates_ws(ws: WebSocket, event_id: str):
     """Push channel for live slot updates."""
 
     await ws.accept()
-    redis = _get_redis()
     channel = f"event:{event_id}"
+    queue = await hub.subscribe(channel)
 
+    # One receive task stays pending so client disconnects are noticed
+    # immediately instead of after the next Redis message.
+    recv_task = asyncio.create_task(ws.receive())
+    queue_task = asyncio.create_task(queue.get())
     try:
-        pubsub = redis.pubsub()
-        await pubsub.subscribe(channel)
-        log.debug("WebSocket subscribed to %s", channel)
-
-        # Simple ping loop (optional but keeps Heroku / nginx happy)
-        async def _ping():
-            while True:
-                await asyncio.sleep(25)
-                try:
-                    await ws.send_text("\uD83D\uDC4B")  # 👋 heartbeat
-                except WebSocketDisconnect:
-                    break
+        while True:
+            done, _ = await asyncio.wait(
+                {recv_task, queue_task},
+                timeout=_POLL_TIMEOUT_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if not done:
+                await ws.send_text("👋")  # 👋 heartbeat
+                continue
 
-        ping_task = asyncio.create_task(_ping())
+            if queue_task in done:
+                await ws.send_text(queue_task.result())
+                queue_task = asyncio.create_task(queue.get())
 
-        async for message in pubsub.listen():  # type: ignore[attr-defined]
-            if message is None:
-                continue
-            if message["type"] != "message":
-                continue
-            payload = message["data"]
-            # Ensure JSON string – redis-py may already give str
-            if not isinstance(payload, str):
-                payload = json.dumps(payload)
-            try:
-                await ws.send_text(payload)
-            except WebSocketDisconnect:
-                break
+            if recv_task in done:
+                received = recv_task.result()
+                if received["type"] == "websocket.disconnect":
+                    break
+                # One-way push: ignore client chatter, keep watching
+                recv_task = asyncio.create_task(ws.receive())
+    except WebSocketDisconnect:
+        pass
     finally:
-        await ws.close()
-        try:
-            await pubsub.unsubscribe(channel)
-            await pubsub.close()
-        except Exception:  # pragma: no cover
-            pass
-        if not ws.client_state.name == "DISCONNECTED":
-            log.debug("WebSocket for event %s disconnected", event_id)
-
-        if ping_task and not ping_task.done():
-            ping_task.cancel()
+        recv_task.cancel()
+        queue_task.cancel()
+        await hub.unsubscribe(channel, queue)
+        if ws.client_state.name != "DISCONNECTED":
+            try:
+                await ws.close()
+            except Exception:  # pragma: no cover
+                pass
+        log.debug("WebSocket for event %s disconnected", event_id)
@@ -1,3 +1,3 @@
 from .config import settings
-from .database import engine, get_session
+from .database import engine, async_engine, get_session, get_async_session
 from .celery_app import celery_app
\ No newline at end of file
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""core/cache.py – tiny Redis response cache for hot read endpoints
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Hand-rolled in the same spirit as the pre-serialised payload caches in
+``api/v1/meta.py``: readers GET a cached JSON payload, writers SETEX it
+with a short TTL.  Event detail pages are keyed per event id; list pages
+additionally embed a *generation counter* in their key, so one INCR on
+any mutation invalidates every cached list page in O(1) — no key scans.
+
+Redis being down must never break reads: every helper swallows
+connection errors and the caller falls back to the SQL path.  Caching is
+disabled entirely under ``APP_ENV=test``.
+"""
+
+import logging
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+EVENT_TTL_SECONDS = 30
+
+_PREFIX = "bme:"
+_GEN_KEY = _PREFIX + "events:gen"
+
+
+def _enabled() -> bool:
+    return settings.APP_ENV != "test"
+
+
+def _redis():
+    # Reuse the shared async client (one pool for WS hub, cache, broadcasts)
+    from app.core.redis import redis_async
+
+    return redis_async
+
+
+async def cache_get(key: str) -> str | None:
+    """Return the cached payload or ``None`` (miss / Redis down)."""
+    if not _enabled():
+        return None
+    try:
+        return await _redis().get(_PREFIX + key)
+    except Exception:  # pragma: no cover – degrade to uncached
+        log.debug("cache_get(%s) failed; serving uncached", key)
+        return None
+
+
+async def cache_set(key: str, payload: str | bytes, ttl: int = EVENT_TTL_SECONDS) -> None:
+    """Best-effort SETEX; failures are ignored."""
+    if not _enabled():
+        return
+    try:
+        await _redis().set(_PREFIX + key, payload, ex=ttl)
+    except Exception:  # pragma: no cover
+        log.debug("cache_set(%s) failed", key)
+
+
+async def list_generation() -> int | None:
+    """Current generation for list-page keys.
+
+    ``0`` only means the key is genuinely unset (INCR starts at 1);
+    ``None`` means the generation is unknown — Redis down, or caching
+    disabled.  Callers must not build cache keys or ETags from ``None``:
+    during an outage the counter is frozen while writes keep landing via
+    SQL, so a synthetic generation would validate stale pages.
+    """
+    if not _enabled():
+        return None
+    try:
+        return int(await _redis().get(_GEN_KEY) or 0)
+    except Exception:  # pragma: no cover
+        return None
+
+
+async def invalidate_event(event_id: str) -> None:
+    """Drop the detail payload and retire every cached list page."""
+    if not _enabled():
+        return
+    try:
+        redis = _redis()
+        await redis.delete(_PREFIX + f"event:{event_id}")
+        await redis.incr(_GEN_KEY)
+    except Exception:  # pragma: no cover
+        log.debug("invalidate_event(%s) failed", event_id)
@@ -30,12 +30,14 @@ log = logging.getLogger(__name__)
 
 celery_app = Celery(
     "scheduler",                       # app name
-    broker=settings.REDIS_URL,
-    backend=settings.REDIS_URL,
+    broker=settings.CELERY_REDIS_URL,  # kombu scheme (redis+socket for sockets)
+    backend=settings.CELERY_REDIS_URL,
     include=[                          # explicit import fallback
         "app.workers.email",
         "app.workers.calendar",
         "app.workers.fx",
+        "app.workers.ratings",
+        "app.workers.popularity",
     ],
 )
 
@@ -49,7 +51,42 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-    worker_prefetch_multiplier=1,      # fair scheduling
+    # Every task here (email, calendar, fx, ratings) is network I/O, so a
+    # green-thread pool multiplexes hundreds of in-flight tasks on one
+    # process instead of one fork per task.  Prefetch 2: we're I/O-bound,
+    # not long-task bound, so a small lookahead keeps workers fed.
+    worker_pool="gevent",
+    worker_concurrency=100,
+    worker_prefetch_multiplier=2,
+    broker_transport_options={"visibility_timeout": 3600},
+    # Fire-and-forget by default: nothing fetches task return values, so
+    # skip the result-backend SET+TTL per task (2-4 Redis RTTs each).
+    # Errors are still recorded for post-mortems; opt back in per task
+    # with ignore_result=False.
+    task_ignore_result=True,
+    task_store_errors_even_if_ignored=True,
+    result_expires=3600,
+    # Ack after completion and re-queue on worker loss: tasks here are
+    # idempotent (email resend, MV/rating refresh, fx fetch), so at-least-
+    # once beats losing work on a crash.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Throughput quotas live in core.ratelimit (Redis sliding window),
+    # which is cluster-wide; skipping Celery's per-worker token-bucket
+    # bookkeeping removes a consumer-side check per task.
+    worker_disable_rate_limits=True,
+    # Bound Kombu's broker connections and retry the broker at boot
+    # instead of crash-looping while Redis comes up.
+    broker_connection_retry_on_startup=True,
+    broker_pool_limit=50,
+    # gzip task bodies / stored errors → less Redis bandwidth + memory.
+    task_compression="gzip",
+    result_compression="gzip",
+    # Safety rails: recycle prefork children (no-op under gevent) and cap
+    # runaway tasks well below the broker visibility timeout.
+    worker_max_tasks_per_child=500,
+    task_time_limit=300,
+    task_soft_time_limit=270,
 )
 
 # ————————————————————————————————————————————————————————————————
@@ -62,16 +99,30 @@ celery_app.conf.task_queues: Sequence[Queue] = (
     Queue("default",   default_exchange, routing_key="default"),
     Queue("emails",    Exchange("emails"),   routing_key="emails"),
     Queue("analytics", Exchange("analytics"), routing_key="analytics"),
+    # ICS generation does disk + CPU work; it gets its own queue so a
+    # prefork worker with -Ofair can drain it without a slow render
+    # sitting in front of the I/O-bound gevent tasks (see compose file).
+    Queue("ics",       Exchange("ics"),      routing_key="ics"),
 )
 
 celery_app.conf.task_default_queue = "default"
 celery_app.conf.task_default_exchange = "default"
 celery_app.conf.task_default_routing_key = "default"
 
-# Example router (extend as needed)
+# Exact task names, not glob patterns: a plain dict routes with one O(1)
+# lookup per task instead of matching every pattern in order — and it
+# can't silently miss tasks registered under short names (the old
+# "app.workers.email.*" glob never matched "email.send_booking_email").
 celery_app.conf.task_routes = {
-    "app.workers.email.*":     {"queue": "emails"},
-    "app.workers.fx.*":        {"queue": "analytics"},
+    "email.send_booking_email": {"queue": "emails"},
+    "email.send_batch":         {"queue": "emails"},
+    "calendar.sync_booking":    {"queue": "default"},
+    "calendar.sync_bulk":       {"queue": "default"},
+    "calendar.cache_ics":       {"queue": "ics"},
+    "fx.refresh_rates":         {"queue": "analytics"},
+    "ratings.recompute":        {"queue": "analytics"},
+    "popularity.refresh":       {"queue": "analytics"},
+    "health.ping":              {"queue": "default"},
 }
 
 # ————————————————————————————————————————————————————————————————
@@ -80,17 +131,22 @@ celery_app.conf.task_routes = {
 
 celery_app.conf.beat_schedule = {
     "refresh-fx-rates": {
-        "task": "app.workers.fx.refresh_rates",
+        "task": "fx.refresh_rates",
         "schedule": timedelta(hours=settings.FX_REFRESH_HOURS),
         "options": {"queue": "analytics"},
     },
+    "refresh-event-popularity": {
+        "task": "popularity.refresh",
+        "schedule": timedelta(minutes=10),
+        "options": {"queue": "analytics"},
+    },
 }
 
 # ————————————————————————————————————————————————————————————————
 # 5. Health task (good for k8s probes)
 # ————————————————————————————————————————————————————————————————
 
-@celery_app.task(name="health.ping")
+@celery_app.task(name="health.ping", ignore_result=False)  # probes read the result
 def ping() -> str:  # noqa: D401
     """Simple ping task to verify worker connectivity."""
     log.debug("↪️  Celery ping received")
@@ -17,16 +17,19 @@ from __future__ import annotations
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Annotated, List, Optional, Tuple
 
+import orjson
 from pydantic import (
     AnyHttpUrl,
     AnyUrl,
-    BaseSettings,
     Field,
     PostgresDsn,
-    validator,
+    ValidationInfo,
+    field_validator,
+    model_validator,
 )
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -42,25 +45,46 @@ class Settings(BaseSettings):
     # ›——————————————————  Hosts / CORS  ——————————————————‹
     BACKEND_HOST: str = "0.0.0.0"
     BACKEND_PORT: int = 8000
-    BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = [
+    # NoDecode: skip the settings source's JSON pre-parse so the validator
+    # below can accept either a JSON array or a comma-separated string.
+    BACKEND_CORS_ORIGINS: Annotated[Tuple[AnyHttpUrl, ...], NoDecode] = (
         "http://localhost:5173",
-    ]
+    )
 
     # ›——————————————————  Database  ——————————————————‹
     DATABASE_URL: PostgresDsn | AnyUrl | str = Field(
         default="sqlite:///./dev.db",
         description="SQLAlchemy URL",
     )
+    # Connection-pool sizing (QueuePool; ignored on SQLite).
+    # Defaults follow the PgBouncer-compatible recipe: short recycle,
+    # no pre-ping (the pooler owns liveness), bounded overflow.
+    DB_POOL_SIZE: int = Field(default=10, description="Persistent pool slots")
+    DB_MAX_OVERFLOW: int = Field(default=5, description="Burst connections above pool_size")
+    DB_POOL_RECYCLE: int = Field(default=60, description="Seconds before a pooled conn is recycled")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait for a free conn")
 
     # ›——————————————————  Cache / Broker  ——————————————————‹
     REDIS_URL: str = "redis://redis:6379/0"
+    # Co-located Redis: point this at the server's unixsocket path (e.g.
+    # /var/run/redis/redis.sock) to skip the TCP stack entirely.  When
+    # set, REDIS_URL is rewritten for the redis clients; Celery speaks a
+    # different scheme for sockets, so it reads CELERY_REDIS_URL below.
+    REDIS_UNIX_SOCKET: Optional[str] = None
 
     # ›——————————————————  E-mail  ——————————————————‹
     EMAIL_BACKEND: str = Field(
         default="console",
-        description="console | ses | sendgrid",
+        description="console | ses | ses_smtp | sendgrid",
     )
     SES_REGION: Optional[str] = None
+    # SES SMTP credentials (distinct from IAM keys) — only needed for the
+    # ses_smtp backend, which reuses one TLS session per worker thread.
+    SES_SMTP_USER: Optional[str] = None
+    SES_SMTP_PASSWORD: Optional[str] = None
+    # Cluster-wide outbound e-mail ceiling (SES: 14/s sandbox, raise per
+    # account quota) — enforced by core.ratelimit across all workers.
+    EMAIL_SENDS_PER_SECOND: int = 14
     SENDGRID_API_KEY: Optional[str] = None
     EMAIL_FROM: str = "no-reply@scheduler.local"
 
@@ -92,25 +116,50 @@ class Settings(BaseSettings):
 
     # ——— Derived / Validators ———————————————————————————
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
-    def assemble_cors(cls, v: str | List[str]) -> List[AnyHttpUrl]:
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
+    def assemble_cors(cls, v: str | List[str]) -> Tuple[str, ...]:
         """
-        Allows comma-separated string or JSON list.
+        Allows comma-separated string or JSON list; frozen to a tuple.
         """
-        if isinstance(v, str) and v.startswith("["):
+        if isinstance(v, str) and v.lstrip().startswith("["):
             # Passed as JSON array
-            return [url.strip().strip('"') for url in v.strip("[]").split(",")]
+            return tuple(orjson.loads(v))
         if isinstance(v, str):
             # Comma-separated
-            return [url.strip() for url in v.split(",")]
-        return v
+            return tuple(p.strip() for p in v.split(",") if p.strip())
+        return tuple(v)
+
+    @model_validator(mode="after")
+    def derive_redis_url(self) -> "Settings":
+        """
+        Prefer the UNIX-socket transport when one is configured.
+        """
+        if self.REDIS_UNIX_SOCKET:
+            self.REDIS_URL = f"unix://{self.REDIS_UNIX_SOCKET}?db=0"
+        return self
 
-    @validator("DEBUG", pre=True)
-    def set_debug_false_in_prod(cls, v, values):
+    @property
+    def CELERY_REDIS_URL(self) -> str:
+        """
+        REDIS_URL in the scheme kombu understands.
+
+        redis-py and kombu disagree on socket URLs: redis-py wants
+        ``unix://{path}`` while kombu only knows ``redis+socket://{path}``
+        (it raises "No such transport: unix" otherwise).  Over TCP the
+        two schemes coincide, so this is a straight pass-through then.
+        """
+        if self.REDIS_UNIX_SOCKET:
+            return f"redis+socket://{self.REDIS_UNIX_SOCKET}"
+        return self.REDIS_URL
+
+    @field_validator("DEBUG", mode="before")
+    @classmethod
+    def set_debug_false_in_prod(cls, v, info: ValidationInfo):
         """
         Force DEBUG=False when APP_ENV == 'prod' unless explicitly set.
         """
-        if values.get("APP_ENV") == "prod":
+        if info.data.get("APP_ENV") == "prod":
             return False
         return v
 
@@ -130,13 +179,15 @@ class Settings(BaseSettings):
 
     # ——— Pydantic config ———————————————————————————————
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
 
 
-# Lazily-initialised singleton (ensures .env parsed only once)
+# Lazily-initialised singleton: the .env walk + URL/DSN validation runs
+# once per process (lru_cache); forked workers inherit the parsed object.
 @lru_cache
 def _get_settings() -> Settings:  # noqa: D401  (fast, cached)
     s = Settings()
@@ -3,9 +3,12 @@ Database layer (SQLModel + SQLAlchemy)
 
 This module exposes:
 
-* `engine` – singleton SQLAlchemy Engine
-* `SessionLocal` – sessionmaker factory
-* `get_session()` – context-managed generator for anywhere in the codebase
+* `engine` – singleton *sync* Engine (Celery workers, Alembic, init_db)
+* `async_engine` – singleton AsyncEngine used by the FastAPI request path
+* `SessionLocal` – sync sessionmaker factory
+* `AsyncSessionLocal` – async_sessionmaker factory
+* `get_session()` – context-managed sync session (workers / scripts)
+* `get_async_session()` – context-managed AsyncSession (API hot path)
 * `init_db()` – create tables on first run (dev convenience)
 
 It stays **framework-agnostic**: no FastAPI imports, so Celery
@@ -15,11 +18,13 @@ workers or Alembic migrations can use it as-is.
 from __future__ import annotations
 
 import logging
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 
@@ -29,23 +34,85 @@ log = logging.getLogger(__name__)
 # Engine
 # ————————————————————————————————————————————————————————————————
 
-# SQLite needs a special flag for multi-thread dev servers
+# SQLite needs a special flag for multi-thread dev servers – and its pools
+# don't accept the sizing knobs QueuePool understands.
 _connect_args: dict = {}
+_pool_kwargs: dict = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+}
 if str(settings.DATABASE_URL).startswith("sqlite"):
     _connect_args["check_same_thread"] = False
+    _pool_kwargs = {}
+
+_sync_kwargs: dict = {}
+if str(settings.DATABASE_URL).startswith("postgresql"):
+    # psycopg2 fast-path for executemany (bulk slot inserts, workers).
+    # The async path doesn't need it: asyncpg batches via SQLAlchemy's
+    # native insertmanyvalues.
+    _sync_kwargs["executemany_mode"] = "values_plus_batch"
 
 engine = create_engine(
     str(settings.DATABASE_URL),
     echo=settings.DEBUG,            # SQL echo in dev
     future=True,                    # SQLAlchemy 2.x style
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
     connect_args=_connect_args,
+    insertmanyvalues_page_size=1000,  # bigger executemany batches per statement
+    query_cache_size=1200,            # keep every hot statement's compiled SQL
+    **_sync_kwargs,
+    **_pool_kwargs,
+)
+
+
+def _async_url(url: str) -> str:
+    """
+    Map a sync SQLAlchemy URL onto its async driver equivalent.
+
+    * ``postgresql://`` (psycopg2)  →  ``postgresql+asyncpg://``
+    * ``sqlite://``                 →  ``sqlite+aiosqlite://``
+    """
+    if url.startswith("postgresql+asyncpg") or url.startswith("sqlite+aiosqlite"):
+        return url
+    if url.startswith("postgresql"):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
+
+
+# pool_pre_ping stays off on the request path: with a short pool_recycle the
+# extra liveness round-trip per checkout costs more than it saves.
+async_engine = create_async_engine(
+    _async_url(str(settings.DATABASE_URL)),
+    echo=settings.DEBUG,
+    pool_pre_ping=False,
+    connect_args=_connect_args,
+    insertmanyvalues_page_size=1000,
+    query_cache_size=1200,
+    **_pool_kwargs,
 )
 
+
+async def warm_async_pool() -> None:
+    """
+    Open (and release) ``pool_size`` connections so early requests on a
+    fresh worker don't each pay TCP + auth setup.  Best-effort: a DB
+    that isn't up yet shouldn't block boot.
+    """
+    if str(settings.DATABASE_URL).startswith("sqlite"):
+        return  # in-process file/memory DB — nothing to warm
+    try:
+        conns = [await async_engine.connect() for _ in range(settings.DB_POOL_SIZE)]
+        for conn in conns:
+            await conn.close()
+    except Exception:  # noqa: BLE001
+        log.warning("DB pool warm-up skipped (database unreachable)")
+
 # ————————————————————————————————————————————————————————————————
-# Session factory
+# Session factories
 # ————————————————————————————————————————————————————————————————
 
 SessionLocal: sessionmaker[Session] = sessionmaker(
@@ -56,6 +123,13 @@ SessionLocal: sessionmaker[Session] = sessionmaker(
     expire_on_commit=False,
 )
 
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 # ————————————————————————————————————————————————————————————————
 # Helper: create tables (DEV only)
@@ -74,7 +148,7 @@ def init_db() -> None:
 
 
 # ————————————————————————————————————————————————————————————————
-# Context-managed session (usable everywhere)
+# Context-managed sessions (usable everywhere)
 # ————————————————————————————————————————————————————————————————
 
 @contextmanager
@@ -96,3 +170,24 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async twin of :func:`get_session` – used by the FastAPI request path.
+
+    Example
+    -------
+    >>> async with get_async_session() as session:
+    ...     users = (await session.exec(select(User))).all()
+    """
+    session: AsyncSession = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:  # noqa: BLE001
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
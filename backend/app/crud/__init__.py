@@ -1,4 +1,4 @@
-from .events import (create_event, get_event, list_events, update_event, delete_event, recompute_event_rating)
-from .bookings import (create_booking, get_booking, booking_exists, booking_count, cancel_booking, list_user_bookings)
+from .events import (create_event, get_event, list_events, update_event, delete_event, apply_review_delta, recompute_event_rating)
+from .bookings import (create_booking, get_booking, get_slot_for_event, booking_exists, booking_count, cancel_booking, list_user_bookings)
 
 from .reviews import (create_review, get_review, list_reviews, review_exists, update_review, delete_review) 
\ No newline at end of file
@@ -6,6 +6,9 @@ Routers and service-layers should call ONLY functions defined here when they
 need to touch Booking rows.  That guarantees all business rules (no double
 booking, capacity check, etc.) are enforced in *one* place.
 
+All helpers are **async** and expect the request-scoped ``AsyncSession``
+provided by ``app.api.deps.db_session``.
+
 Functions
 ---------
 create_booking()          – create & return a new row
@@ -19,11 +22,11 @@ list_user_bookings()      – paginated list for “My Bookings” page
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session
+from sqlalchemy import and_, func, lambda_stmt, or_, select, update
+from sqlalchemy.orm import joinedload
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.booking import Booking, BookingStatus
 from app.models.event import Event
@@ -34,15 +37,15 @@ from app.models.slot import Slot
 # ────────────────────────────────────────────────────────────────
 
 
-def create_booking(
-    session: Session,
+async def create_booking(
+    session: AsyncSession,
     *,
     slot_id: str,
     name: str,
     email: str,
 ) -> Booking:
     """
-    Inserts a new CONFIRMED booking and returns it.
+    Inserts a new CONFIRMED booking and returns it (slot + event loaded).
 
     Caller MUST have already validated:
     * capacity (booking_count < max_bookings)
@@ -53,12 +56,11 @@ def create_booking(
         name=name,
         email=email,
         status=BookingStatus.CONFIRMED,
-        booked_at=datetime.utcnow(),
     )
     session.add(booking)
-    session.commit()
-    session.refresh(booking)
-    return booking
+    await session.commit()
+    # Re-select so slot → event are eager-loaded for the response layer
+    return await get_booking(session, booking.id)
 
 
 # ────────────────────────────────────────────────────────────────
@@ -66,50 +68,78 @@ def create_booking(
 # ────────────────────────────────────────────────────────────────
 
 
-def get_booking(session: Session, booking_id: str) -> Booking | None:
+async def get_booking(session: AsyncSession, booking_id: str) -> Booking | None:
     """
     Eager-loads slot + event so the response layer has everything.
+
+    The booking → slot → event chain is many-to-one, so a JOIN pulls all
+    three in one query; remaining / is_full come from the slot's stored
+    ``booked_count``, loaded in the same statement.
+
+    Wrapped in ``lambda_stmt`` (as are the probes below) so the Select
+    construction itself is cached — per call only the closure values are
+    extracted as bind parameters, skipping the Core build + compile work
+    on this per-request path.
     """
-    stmt = (
-        select(Booking)
+    stmt = lambda_stmt(
+        lambda: select(Booking)
         .where(Booking.id == booking_id)
         .options(
-            selectinload(Booking.slot)
-            .selectinload(Slot.event)  # chain: booking → slot → event
+            joinedload(Booking.slot)
+            .joinedload(Slot.event),  # chain: booking → slot → event
         )
     )
-    return session.exec(stmt).one_or_none()
+    return (await session.exec(stmt)).scalars().one_or_none()
+
+
+async def get_slot_for_event(
+    session: AsyncSession,
+    slot_id: str,
+    event_id: str,
+) -> Slot | None:
+    """
+    Fetch a slot, checking it belongs to the given event.
+
+    Returns ``None`` when the slot doesn't exist or belongs to another
+    event, so the router can 400 without a second query.  Occupancy rides
+    along in the row itself (``booked_count``).
+    """
+    stmt = select(Slot).where(Slot.id == slot_id, Slot.event_id == event_id)
+    return (await session.exec(stmt)).scalars().one_or_none()
 
 
-def booking_exists(session: Session, slot_id: str, email: str) -> bool:
+async def booking_exists(session: AsyncSession, slot_id: str, email: str) -> bool:
     """
     Returns True if a CONFIRMED booking with this slot & e-mail already exists.
     """
-    stmt = (
-        select(func.count())
-        .select_from(Booking)
+    # LIMIT 1 probe instead of COUNT(*): the index scan stops at the first
+    # match rather than counting every qualifying row.
+    stmt = lambda_stmt(
+        lambda: select(Booking.id)
         .where(
             Booking.slot_id == slot_id,
             Booking.email == email,
             Booking.status == BookingStatus.CONFIRMED,
         )
+        .limit(1)
     )
-    return session.exec(stmt).scalar_one() > 0
+    return (await session.exec(stmt)).first() is not None
 
 
-def booking_count(session: Session, slot_id: str) -> int:
+async def booking_count(session: AsyncSession, slot_id: str) -> int:
     """
     CONFIRMED bookings only – used to check capacity.
+
+    Counting the indexed column (not *) keeps this an index-only scan on
+    the partial CONFIRMED index from migration 0002.
     """
-    stmt = (
-        select(func.count())
-        .select_from(Booking)
-        .where(
+    stmt = lambda_stmt(
+        lambda: select(func.count(Booking.slot_id)).where(
             Booking.slot_id == slot_id,
             Booking.status == BookingStatus.CONFIRMED,
         )
     )
-    return session.exec(stmt).scalar_one()
+    return (await session.exec(stmt)).scalar_one()
 
 
 # ────────────────────────────────────────────────────────────────
@@ -117,17 +147,39 @@ def booking_count(session: Session, slot_id: str) -> int:
 # ────────────────────────────────────────────────────────────────
 
 
-def cancel_booking(session: Session, booking: Booking) -> Booking:
+async def cancel_booking(session: AsyncSession, booking_id: str) -> Booking | None:
     """
-    Marks the row as CANCELLED (idempotent).
+    Flips CONFIRMED → CANCELLED in ONE atomic statement.
+
+    ``UPDATE … WHERE id = :id AND status = 'CONFIRMED' RETURNING slot_id``
+    replaces the old SELECT-then-UPDATE dance: when no row comes back the
+    booking is either missing or already cancelled, and the caller can
+    decide which with a single (cold-path) lookup.  On success the slot's
+    denormalised ``booked_count`` is decremented in the same transaction,
+    releasing the seat.  Returns the eager-loaded booking, or ``None``.
     """
-    if booking.status == BookingStatus.CANCELLED:
-        return booking
-    booking.status = BookingStatus.CANCELLED
-    session.add(booking)
-    session.commit()
-    session.refresh(booking)
-    return booking
+    row = (
+        await session.exec(
+            update(Booking)
+            .where(
+                Booking.id == booking_id,
+                Booking.status == BookingStatus.CONFIRMED,
+            )
+            .values(status=BookingStatus.CANCELLED)
+            .returning(Booking.slot_id)
+        )
+    ).first()
+    if row is None:
+        await session.commit()
+        return None
+    await session.exec(
+        update(Slot)
+        .where(Slot.id == row.slot_id, Slot.booked_count > 0)
+        .values(booked_count=Slot.booked_count - 1)
+    )
+    await session.commit()
+    # Re-select so slot → event are eager-loaded for response & broadcast
+    return await get_booking(session, booking_id)
 
 
 # ────────────────────────────────────────────────────────────────
@@ -135,31 +187,60 @@ def cancel_booking(session: Session, booking: Booking) -> Booking:
 # ────────────────────────────────────────────────────────────────
 
 
-def list_user_bookings(
-    session: Session,
+async def list_user_bookings(
+    session: AsyncSession,
     *,
     email: str,
     page: int = 1,
     size: int = 50,
-) -> Tuple[List[Booking], int]:
+    cursor: Optional[Tuple[datetime, str]] = None,
+    with_total: bool = False,
+) -> Tuple[List[Booking], Optional[Tuple[datetime, str]], Optional[int]]:
     """
     Returns paginated bookings for “My bookings” (sorted newest first).
+
+    Keyset pagination: when ``cursor`` (a ``(booked_at, id)`` pair) is
+    given, the query seeks past it instead of OFFSET-scanning; ``page``
+    is the legacy fallback.  Returns ``(rows, next_key, total)`` where
+    ``next_key`` is the cursor for the following page (or ``None`` at the
+    end) and ``total`` is only computed when ``with_total`` is set —
+    folded into the main query as a window count, not a second round trip.
     """
     stmt = (
         select(Booking)
         .where(Booking.email == email)
         .options(
-            selectinload(Booking.slot)
-            .selectinload(Slot.event)
+            joinedload(Booking.slot)
+            .joinedload(Slot.event)  # many-to-one → single JOIN, no extra RTTs
         )
-        .order_by(Booking.booked_at.desc())
+        .order_by(Booking.booked_at.desc(), Booking.id.desc())
     )
 
-    total = session.exec(
-        select(func.count()).select_from(stmt.subquery())
-    ).scalar_one()
-    bookings = (
-        session.exec(stmt.offset((page - 1) * size).limit(size))
-        .all()
+    if cursor is not None:
+        ts, row_id = cursor
+        stmt = stmt.where(
+            or_(
+                Booking.booked_at < ts,
+                and_(Booking.booked_at == ts, Booking.id < row_id),
+            )
+        )
+    else:
+        stmt = stmt.offset((page - 1) * size)
+
+    total: Optional[int] = None
+    if with_total and cursor is None:
+        rows = (
+            await session.exec(
+                stmt.add_columns(func.count().over().label("total")).limit(size + 1)
+            )
+        ).all()
+        total = rows[0][1] if rows else 0
+        fetched = [row[0] for row in rows]
+    else:
+        fetched = (await session.exec(stmt.limit(size + 1))).scalars().all()
+
+    bookings = fetched[:size]
+    next_key = (
+        (bookings[-1].booked_at, bookings[-1].id) if len(fetched) > size else None
     )
-    return bookings, total
+    return bookings, next_key, total
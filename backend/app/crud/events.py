@@ -5,6 +5,9 @@ Event CRUD helpers
 All DB-facing logic for the Event domain lives here so that
 routers / services stay skinny and pure-business.
 
+All helpers are **async** and expect the request-scoped ``AsyncSession``
+provided by ``app.api.deps.db_session``.
+
 Functions
 ---------
 create_event()          – POST /events
@@ -17,17 +20,20 @@ recompute_event_rating()– called after each review
 
 from __future__ import annotations
 
+import hashlib
+import random
 from datetime import datetime
 from typing import List, Optional, Sequence, Tuple
+from uuid import uuid4
 
-from sqlalchemy import and_, desc, func, select, text
-from sqlalchemy.orm import joinedload, selectinload
-from sqlmodel import Session
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.orm import selectinload
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.booking import Booking
 from app.models.event import Event
 from app.models.review import Review
 from app.models.slot import Slot
+from app.schemas.event import EventFilter
 
 
 # ────────────────────────────────────────────────────────────────
@@ -35,8 +41,8 @@ from app.models.slot import Slot
 # ────────────────────────────────────────────────────────────────
 
 
-def create_event(
-    session: Session,
+async def create_event(
+    session: AsyncSession,
     *,
     title: str,
     description: str,
@@ -65,24 +71,28 @@ def create_event(
         currency=currency,
         timezone=timezone,
         image_url=image_url,
-        created_at=datetime.utcnow(),
     )
     session.add(event)
-    session.flush()  # assigns PK
-
-    session.add_all(
-        [
-            Slot(
-                event_id=event.id,
-                start_utc=slot["start_utc"],
-                max_bookings=slot.get("max_bookings", 1),
-            )
+    await session.flush()  # assigns PK
+
+    # Bulk executemany INSERT: one round-trip for all slots instead of a
+    # unit-of-work flush per row (SQLAlchemy batches the VALUES clauses).
+    # created_at is omitted so the server default stamps all rows alike.
+    await session.exec(
+        insert(Slot),
+        params=[
+            {
+                "id": str(uuid4()),
+                "event_id": event.id,
+                "start_utc": slot["start_utc"],
+                "max_bookings": slot.get("max_bookings", 1),
+            }
             for slot in slots
-        ]
+        ],
     )
-    session.commit()
-    session.refresh(event)
-    return event
+    await session.commit()
+    # Re-select so slots (and their bookings) are eager-loaded for the response
+    return await get_event(session, event.id)
 
 
 # ────────────────────────────────────────────────────────────────
@@ -90,9 +100,12 @@ def create_event(
 # ────────────────────────────────────────────────────────────────
 
 
-def get_event(session: Session, event_id: str) -> Optional[Event]:
+async def get_event(session: AsyncSession, event_id: str) -> Optional[Event]:
     """
     Returns an Event with eagerly-loaded slots & reviews or None.
+
+    Slot occupancy comes from the ``booking_count`` column property (part
+    of the slot SELECT itself), so the booking rows are never hydrated.
     """
     stmt = (
         select(Event)
@@ -102,12 +115,27 @@ def get_event(session: Session, event_id: str) -> Optional[Event]:
         )
         .where(Event.id == event_id)
     )
-    return session.exec(stmt).one_or_none()
+    return (await session.exec(stmt)).scalars().one_or_none()
+
+
+def _open_slots_subquery():
+    """
+    Aggregate: per event, how many slots still have a free seat.
+
+    Reads the denormalised ``Slot.booked_count`` counter, so the list
+    route never touches the booking table to compute `remaining_slots`.
+    """
+    return (
+        select(Slot.event_id, func.count(Slot.id).label("open_slots"))
+        .where(Slot.booked_count < Slot.max_bookings)
+        .group_by(Slot.event_id)
+        .subquery()
+    )
 
 
-# Pagination returns (objects, total_count)
-def list_events(
-    session: Session,
+# Each returned row is (Event, open_slot_count)
+async def list_events(
+    session: AsyncSession,
     *,
     page: int = 1,
     size: int = 20,
@@ -116,60 +144,98 @@ def list_events(
     price_min: Optional[int] = None,
     price_max: Optional[int] = None,
     sort: str = "recent",  # recent | price | rating | popularity
-) -> Tuple[List[Event], int]:
+    cursor: Optional[Tuple[datetime, str]] = None,
+    with_total: bool = False,
+) -> Tuple[List[Tuple[Event, int]], Optional[Tuple[datetime, str]], Optional[int]]:
     """
     Flexible listing with filters & sorting.
 
     * `search` does ILIKE on title / description / host
     * `price_min`/`price_max` filter by stored minor units
+
+    The open-slot count is joined as a SQL aggregate, so one statement
+    serves the whole card grid (no per-event slot/booking loads).
+
+    Pagination is keyset-first: for the default ``recent`` sort a
+    ``(created_at, id)`` cursor seeks straight to the page (O(size) index
+    reads, no COUNT), while other sorts and the legacy ``page`` parameter
+    fall back to OFFSET.  Returns ``(rows, next_key, total)``; ``total``
+    is only computed when ``with_total`` is requested — folded into the
+    main query as a window count, not a second round trip.
     """
-    stmt = select(Event)
-
-    # — Filters —
-    from app.services.search import build_event_query 
-    stmt, count_stmt = build_event_query(session, filters=EventFilter(page=page, size=size, search=search, 
-                                                                      category=category, 
-                                                                      price_min=price_min, price_max=price_max, sort=sort))
-
-    # — Sorting —
-    match sort:
-        case "price":
-            stmt = stmt.order_by(Event.price_minor.asc())
-        case "rating":
-            stmt = stmt.order_by(Event.rating_avg.desc().nullslast())
-        case "popularity":
-            # popularity = confirmed bookings in last 30 days
-            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-            popularity_sub = (
-                select(Booking.slot_id, func.count(Booking.id).label("pop"))
-                .where(
-                    Booking.booked_at >= thirty_days_ago,
-                    Booking.status == "CONFIRMED",
-                )
-                .group_by(Booking.slot_id)
-                .subquery()
-            )
-            stmt = (
-                stmt.join(
-                    popularity_sub,
-                    popularity_sub.c.slot_id == Slot.id,
-                    isouter=True,
-                )
-                .order_by(popularity_sub.c.pop.desc().nullslast())
-                .order_by(Event.created_at.desc())
-            )
-        case _:
-            stmt = stmt.order_by(Event.created_at.desc())
+    from app.services.search import build_event_query  # local import avoids cycles
 
-    # — Pagination —
-    total = session.exec(select(func.count()).select_from(stmt.subquery())).scalar_one()
-    stmt = (
-        stmt.options(selectinload(Event.slots))
-        .offset((page - 1) * size)
-        .limit(size)
+    filters = EventFilter(
+        page=page,
+        size=size,
+        search=search,
+        category=category,
+        price_min=price_min,
+        price_max=price_max,
+        sort=sort,
     )
-    events = session.exec(stmt).all()
-    return events, total
+    stmt, _ = build_event_query(session, filters=filters)
+
+    open_slots = _open_slots_subquery()
+    stmt = stmt.add_columns(
+        func.coalesce(open_slots.c.open_slots, 0).label("remaining_slots")
+    ).outerjoin(open_slots, open_slots.c.event_id == Event.id)
+
+    # — Pagination —
+    # Cursors only make sense for a stable key; that's the "recent"
+    # (created_at DESC) ordering, with id as tie-break.
+    use_keyset = cursor is not None and sort == "recent"
+    if use_keyset:
+        ts, row_id = cursor
+        stmt = stmt.where(
+            or_(
+                Event.created_at < ts,
+                and_(Event.created_at == ts, Event.id < row_id),
+            )
+        )
+    else:
+        stmt = stmt.offset((page - 1) * size)
+    if sort == "recent":
+        stmt = stmt.order_by(Event.id.desc())  # appended tie-break
+
+    total: Optional[int] = None
+    if with_total and cursor is None:
+        # The total is shared by every page of the same filter set, so it
+        # is cached under gen:filter-hash (page/size excluded).  The
+        # generation counter retires it on any event mutation; the short
+        # jittered TTL keeps misses from expiring in lock-step.
+        from app.core.cache import cache_get, cache_set, list_generation
+
+        generation = await list_generation()
+        cached_total = None
+        if generation is not None:  # unknown generation → never trust/fill the cache
+            filter_hash = hashlib.blake2s(
+                filters.model_dump_json(exclude={"page", "size"}).encode()
+            ).hexdigest()
+            count_key = f"events:count:{generation}:{filter_hash}"
+            cached_total = await cache_get(count_key)
+        if cached_total is not None:
+            total = int(cached_total)
+            rows = (await session.exec(stmt.limit(size + 1))).all()
+        else:
+            rows = (
+                await session.exec(
+                    stmt.add_columns(func.count().over().label("total")).limit(size + 1)
+                )
+            ).all()
+            total = rows[0][2] if rows else 0
+            rows = [(event, remaining) for event, remaining, _ in rows]
+            if generation is not None:
+                await cache_set(count_key, str(total), ttl=20 + random.randint(0, 5))
+    else:
+        rows = (await session.exec(stmt.limit(size + 1))).all()
+    events = [(event, remaining) for event, remaining in rows[:size]]
+
+    next_key: Optional[Tuple[datetime, str]] = None
+    if sort == "recent" and len(rows) > size:
+        last = events[-1][0]
+        next_key = (last.created_at, last.id)
+    return events, next_key, total
 
 
 # ────────────────────────────────────────────────────────────────
@@ -177,22 +243,25 @@ def list_events(
 # ────────────────────────────────────────────────────────────────
 
 
-def update_event(session: Session, event: Event, **data) -> Event:
+async def update_event(session: AsyncSession, event: Event, **data) -> Event:
     """
     Patch‐style update; only keys present in `data` are updated.
+
+    The caller fetched ``event`` eager-loaded and only scalar columns
+    change here, so with ``expire_on_commit=False`` the instance stays
+    fully usable after commit — no re-select needed.
     """
     for key, value in data.items():
         if hasattr(event, key) and value is not None:
             setattr(event, key, value)
     session.add(event)
-    session.commit()
-    session.refresh(event)
+    await session.commit()
     return event
 
 
-def delete_event(session: Session, event: Event) -> None:
-    session.delete(event)
-    session.commit()
+async def delete_event(session: AsyncSession, event: Event) -> None:
+    await session.delete(event)
+    await session.commit()
 
 
 # ────────────────────────────────────────────────────────────────
@@ -200,27 +269,73 @@ def delete_event(session: Session, event: Event) -> None:
 # ────────────────────────────────────────────────────────────────
 
 
-def recompute_event_rating(session: Session, event_id: str) -> None:
+async def apply_review_delta(
+    session: AsyncSession,
+    event_id: str,
+    *,
+    new_rating: Optional[int] = None,
+    old_rating: Optional[int] = None,
+) -> None:
     """
-    Re-aggregates average and count into the denormalised columns.
-    Call after each review add/delete.
+    O(1) incremental maintenance of the denormalised rating columns.
+
+    Pass ``new_rating`` on insert, ``old_rating`` on delete, and both on
+    edit — the running sum is adjusted without scanning the review table.
+    The event row is locked first (``FOR UPDATE``; a no-op on SQLite) so
+    concurrent review writes on the same event serialise.  Runs inside
+    the caller's transaction: no commit here.
     """
-    stats = (
-        session.exec(
-            select(
-                func.avg(Review.rating).label("avg"),
-                func.count(Review.id).label("cnt"),
-            ).where(Review.event_id == event_id)
-        )
-        .first()
-        or (None, 0)
+    delta = int(new_rating is not None) - int(old_rating is not None)
+    await session.exec(
+        select(Event.id).where(Event.id == event_id).with_for_update()
     )
-    avg, cnt = stats
-    session.exec(
-        (
-            Event.__table__.update()
-            .where(Event.id == event_id)
-            .values(rating_avg=avg, rating_count=cnt)
+    new_sum = (
+        func.coalesce(Event.rating_avg, 0.0) * Event.rating_count
+        + (new_rating or 0)
+        - (old_rating or 0)
+    )
+    await session.exec(
+        update(Event)
+        .where(Event.id == event_id)
+        .values(
+            rating_avg=new_sum / func.nullif(Event.rating_count + delta, 0),
+            rating_count=Event.rating_count + delta,
         )
     )
-    session.commit()
+
+
+def rating_recompute_stmt(event_id: str):
+    """
+    The single-statement rating re-aggregation, as a Core expression so
+    both the async request path and sync Celery workers can execute it.
+    """
+    avg_sub = (
+        select(func.avg(Review.rating))
+        .where(Review.event_id == event_id)
+        .scalar_subquery()
+    )
+    cnt_sub = (
+        select(func.count(Review.id))
+        .where(Review.event_id == event_id)
+        .scalar_subquery()
+    )
+    return (
+        update(Event)
+        .where(Event.id == event_id)
+        .values(rating_avg=avg_sub, rating_count=cnt_sub)
+    )
+
+
+async def recompute_event_rating(session: AsyncSession, event_id: str) -> None:
+    """
+    Full re-aggregation of average and count from the review table.
+
+    The hot path maintains the columns incrementally via
+    :func:`apply_review_delta`; keep this as a repair/backfill tool in
+    case the denormalised values ever drift.
+
+    One UPDATE with correlated aggregate subqueries: the DB computes
+    AVG/COUNT in place of the old SELECT → UPDATE → COMMIT round trips.
+    Runs inside the caller's transaction — no commit here.
+    """
+    await session.exec(rating_recompute_stmt(event_id))
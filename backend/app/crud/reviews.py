@@ -4,41 +4,45 @@ from __future__ import annotations
 ----------------------------------
 Routers & services should use ONLY these helpers when touching the
 `review` table so that rating roll‑ups stay consistent.
+
+All helpers are **async** and expect the request-scoped ``AsyncSession``
+provided by ``app.api.deps.db_session``.
 """
 
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import selectinload
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.crud.events import recompute_event_rating
+from app.crud.events import apply_review_delta
 from app.models.review import Review
 
 # ---------------------------------------------------------------------------
 # Helpers / constraints
 # ---------------------------------------------------------------------------
 
-def review_exists(session: Session, *, booking_id: str) -> bool:
+async def review_exists(session: AsyncSession, *, booking_id: str) -> bool:
     """Return **True** if a review already exists for this booking."""
-    stmt = select(func.count()).select_from(Review).where(Review.booking_id == booking_id)
-    return session.exec(stmt).scalar_one() > 0
+    # LIMIT 1 probe — presence only, no row counting (see booking_exists).
+    stmt = select(Review.id).where(Review.booking_id == booking_id).limit(1)
+    return (await session.exec(stmt)).first() is not None
 
 
 # ---------------------------------------------------------------------------
 # CRUD operations
 # ---------------------------------------------------------------------------
 
-def create_review(
-    session: Session,
+async def create_review(
+    session: AsyncSession,
     *,
     event_id: str,
     booking_id: str,
     rating: int,
     comment: Optional[str] = None,
 ) -> Review:
-    if review_exists(session, booking_id=booking_id):
+    if await review_exists(session, booking_id=booking_id):
         raise ValueError("This booking already has a review.")
 
     review = Review(
@@ -46,54 +50,92 @@ def create_review(
         booking_id=booking_id,
         rating=rating,
         comment=comment,
-        created_at=datetime.utcnow(),
     )
     session.add(review)
-    session.commit()
-    session.refresh(review)
-
-    recompute_event_rating(session, event_id)
+    # Row insert + O(1) aggregate bump commit together
+    await apply_review_delta(session, event_id, new_rating=rating)
+    await session.commit()
     return review
 
 
-def get_review(session: Session, review_id: str) -> Optional[Review]:
+async def get_review(session: AsyncSession, review_id: str) -> Optional[Review]:
     stmt = select(Review).where(Review.id == review_id)
-    return session.exec(stmt).one_or_none()
+    return (await session.exec(stmt)).scalars().one_or_none()
 
 
-def list_reviews(
-    session: Session,
+async def list_reviews(
+    session: AsyncSession,
     *,
     event_id: str,
     page: int = 1,
     size: int = 20,
-) -> Tuple[List[Review], int]:
+    cursor: Optional[Tuple[datetime, str]] = None,
+    with_total: bool = False,
+) -> Tuple[List[Review], Optional[Tuple[datetime, str]], Optional[int]]:
+    """Newest-first listing with keyset pagination.
+
+    ``cursor`` is a ``(created_at, id)`` pair; when given the query seeks
+    past it instead of OFFSET-scanning.  Returns ``(rows, next_key, total)``
+    — ``total`` is only computed when ``with_total`` is set, via a window
+    count folded into the main query.
+    """
     stmt = (
         select(Review)
         .where(Review.event_id == event_id)
-        .order_by(Review.created_at.desc())
+        .order_by(Review.created_at.desc(), Review.id.desc())
         .options(selectinload(Review.booking))
     )
 
-    total = session.exec(select(func.count()).select_from(stmt.subquery())).scalar_one()
-    reviews = session.exec(stmt.offset((page - 1) * size).limit(size)).all()
-    return reviews, total
+    if cursor is not None:
+        ts, row_id = cursor
+        stmt = stmt.where(
+            or_(
+                Review.created_at < ts,
+                and_(Review.created_at == ts, Review.id < row_id),
+            )
+        )
+    else:
+        stmt = stmt.offset((page - 1) * size)
+
+    total: Optional[int] = None
+    if with_total and cursor is None:
+        rows = (
+            await session.exec(
+                stmt.add_columns(func.count().over().label("total")).limit(size + 1)
+            )
+        ).all()
+        total = rows[0][1] if rows else 0
+        fetched = [row[0] for row in rows]
+    else:
+        fetched = (await session.exec(stmt.limit(size + 1))).scalars().all()
+
+    reviews = fetched[:size]
+    next_key = (
+        (reviews[-1].created_at, reviews[-1].id) if len(fetched) > size else None
+    )
+    return reviews, next_key, total
 
 
-def update_review(session: Session, review: Review, **data) -> Review:
+async def update_review(session: AsyncSession, review: Review, **data) -> Review:
+    old_rating = review.rating
     for key, value in data.items():
         if value is not None and hasattr(review, key):
             setattr(review, key, value)
     session.add(review)
-    session.commit()
-    session.refresh(review)
-
-    recompute_event_rating(session, review.event_id)
+    if review.rating != old_rating:
+        await apply_review_delta(
+            session,
+            review.event_id,
+            new_rating=review.rating,
+            old_rating=old_rating,
+        )
+    await session.commit()
     return review
 
 
-def delete_review(session: Session, review: Review) -> None:
+async def delete_review(session: AsyncSession, review: Review) -> None:
     event_id = review.event_id
-    session.delete(review)
-    session.commit()
-    recompute_event_rating(session, event_id)
+    old_rating = review.rating
+    await session.delete(review)
+    await apply_review_delta(session, event_id, old_rating=old_rating)
+    await session.commit()
@@ -11,6 +11,7 @@ from typing import List
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core import settings
 from app.core.database import init_db
@@ -26,13 +27,16 @@ app = FastAPI(
     title=settings.APP_NAME,
     version="1.0.0",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,  # orjson is ~3-5× faster than stdlib json
 )
 
 # ────────────────────────────────────────────────────────────────
 # CORS (origins pulled from .env)
 # ────────────────────────────────────────────────────────────────
 
-allow_origins: List[str] = [str(o) for o in settings.BACKEND_CORS_ORIGINS]
+# pydantic-2 URL objects normalise with a trailing slash; strip it back
+# off so the values match browser Origin headers exactly.
+allow_origins: List[str] = [str(o).rstrip("/") for o in settings.BACKEND_CORS_ORIGINS]
 
 app.add_middleware(
     CORSMiddleware,
@@ -74,6 +78,17 @@ def root() -> dict[str, str]:
     return {"docs": "/docs", "redoc": "/redoc"}
 
 
+@app.get("/debug/pool", include_in_schema=False)
+def pool_status() -> dict[str, str]:
+    """Connection-pool observability (checked-out / overflow counters)."""
+    from app.core.database import async_engine, engine
+
+    return {
+        "async": async_engine.pool.status(),
+        "sync": engine.pool.status(),
+    }
+
+
 # ────────────────────────────────────────────────────────────────
 # Startup (dev DB init + banner)
 # ────────────────────────────────────────────────────────────────
@@ -87,5 +102,21 @@ def _startup() -> None:  # noqa: D401
     if settings.APP_ENV in {"dev", "test"}:
         init_db()
 
+    # Pre-warm one Redis connection so the first broadcast doesn't pay
+    # the TCP/AUTH handshake; absence of Redis shouldn't block startup.
+    try:
+        from app.core.redis import redis_conn
+
+        redis_conn.ping()
+    except Exception:  # noqa: BLE001
+        logging.getLogger(__name__).warning("Redis unreachable at startup")
+
     # Write a .gitignore'd banner so Dockerfile's healthcheck can ping it
     Path("/tmp/app_started").touch(exist_ok=True)
+
+
+@app.on_event("startup")
+async def _warm_db_pool() -> None:  # noqa: D401
+    from app.core.database import warm_async_pool
+
+    await warm_async_pool()
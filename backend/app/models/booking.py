@@ -11,14 +11,14 @@ Rules enforced
 * UTC timestamp for created row
 """
 
-from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint, Uuid, func
+from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -40,29 +40,35 @@ class Booking(SQLModel, table=True):
     # ——— Core columns ————————————————————————————
     id: str = Field(
         default_factory=lambda: str(uuid4()),
-        primary_key=True,
-        index=True,
+        sa_column=Column(Uuid(as_uuid=False), primary_key=True, index=True),
     )
 
     slot_id: str = Field(
-        foreign_key="slot.id",
-        nullable=False,
-        index=True,
+        sa_column=Column(
+            Uuid(as_uuid=False), ForeignKey("slot.id"), nullable=False, index=True
+        ),
         description="FK to Slot",
     )
 
-    name: str = Field(nullable=False, sa_column=Column(String))
-    email: str = Field(nullable=False, sa_column=Column(String, index=True))
+    name: str = Field(sa_column=Column(String, nullable=False))
+    email: str = Field(sa_column=Column(String, nullable=False, index=True))
 
+    # Native ENUM on Postgres (4-byte values, int comparisons, narrower
+    # rows); degrades to VARCHAR + CHECK on SQLite.  Migration 0009 casts
+    # the previously string-typed column in place.
     status: BookingStatus = Field(
         default=BookingStatus.CONFIRMED,
-        sa_column=Column(String),
+        sa_column=Column(SAEnum(BookingStatus, name="booking_status"), nullable=False),
         description="CONFIRMED | CANCELLED",
     )
 
+    # Client default for ORM construction; server default covers non-ORM
+    # inserts (bulk loads, fixtures) and keeps timestamps clock-skew-safe.
     booked_at: datetime = Field(
         default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), nullable=False),
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
     )
 
     # ——— Relationships ——————————————————————————
@@ -77,6 +83,32 @@ class Booking(SQLModel, table=True):
     def is_active(self) -> bool:
         """Returns True if the booking hasn't been cancelled."""
         return self.status == BookingStatus.CONFIRMED
+
+    # Read-schema proxies (require slot → event to be eager-loaded)
+
+    @property
+    def event_id(self) -> str:
+        return self.slot.event_id
+
+    @property
+    def event_title(self) -> str:
+        return self.slot.event.title
+
+    @property
+    def start_utc(self) -> datetime:
+        return self.slot.start_utc
+
+    @property
+    def currency(self) -> str:
+        return self.slot.event.currency
+
+    @property
+    def price_minor(self) -> int:
+        return self.slot.event.price_minor
+
+    @property
+    def image_url(self) -> Optional[str]:
+        return self.slot.event.image_url
         
 
 # ——— Deferred imports to avoid circular refs —————————
@@ -9,43 +9,62 @@ Key features
 * UUID primary key
 * UTC `created_at`
 * Denormalised `rating_avg` + `rating_count`
-* `search_vector` column (PostgreSQL only) for full-text search
+* `search_vector` generated tsvector (PostgreSQL only), GIN-indexed
 * Relationships:
     Event 1─∞ Slot
     Event 1─∞ Review
 """
 
-from __future__ import annotations
 
 from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Computed, String, Text, Uuid, func
 from sqlmodel import Field, Relationship, SQLModel
 
-# Conditional import → lets the model still be imported when
-# you're running on SQLite (dialect has no TSVECTOR type).
-try:
+from app.core.config import settings
+
+# Expression behind the generated search_vector column (migration 0008).
+# Kept here as the single source of truth so model and migration agree.
+SEARCH_VECTOR_EXPR = (
+    "to_tsvector('english', coalesce(title,'') || ' ' || "
+    "coalesce(description,'') || ' ' || coalesce(host_name,''))"
+)
+
+# TSVECTOR (and GENERATED … AS to_tsvector) only exist on PostgreSQL.
+# On SQLite dev/test the column degrades to a plain nullable TEXT that is
+# never populated — search falls back to LIKE there anyway.
+if str(settings.DATABASE_URL).startswith("postgresql"):
     from sqlalchemy.dialects.postgresql import TSVECTOR
-except ImportError:  # pragma: no cover
-    TSVECTOR = String  # type: ignore[assignment]
+
+    _search_vector_column = Column(
+        "search_vector",
+        TSVECTOR(),
+        Computed(SEARCH_VECTOR_EXPR, persisted=True),
+        nullable=True,
+    )
+else:
+    _search_vector_column = Column("search_vector", Text(), nullable=True)
 
 
 class Event(SQLModel, table=True):
     __tablename__ = "event"
 
     # ——— Basic columns ————————————————————————————
+    # Native UUID storage (16 bytes + faster index compares on Postgres);
+    # values stay plain strings at the Python/API level.  The client-side
+    # default keeps SQLite dev/test working; Postgres additionally has a
+    # gen_random_uuid() server default for non-ORM inserts (migration 0003).
     id: str = Field(
         default_factory=lambda: str(uuid4()),
-        primary_key=True,
-        index=True,
+        sa_column=Column(Uuid(as_uuid=False), primary_key=True, index=True),
         description="UUID primary key",
     )
 
-    title: str = Field(nullable=False, sa_column=Column("title", String, index=True))
-    description: str = Field(nullable=False, sa_column=Column(String))
-    host_name: str = Field(nullable=False, sa_column=Column(String, index=True))
+    title: str = Field(sa_column=Column("title", String, nullable=False, index=True))
+    description: str = Field(sa_column=Column(String, nullable=False))
+    host_name: str = Field(sa_column=Column(String, nullable=False, index=True))
     category: str = Field(nullable=False, index=True)
     duration_min: int = Field(nullable=False, gt=0, description="Event length in minutes")
 
@@ -76,23 +95,35 @@ class Event(SQLModel, table=True):
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
         nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
         description="UTC creation timestamp",
     )
 
     # ——— Full-text search column (Postgres) —————————
+    # DB-generated (GENERATED ALWAYS … STORED) on PG, so the ORM treats it
+    # as read-only; indexed by the GIN ix_event_search_vec, not a btree —
+    # a btree on tsvector can't serve @@ queries.
     search_vector: Optional[str] = Field(
-        sa_column=Column(
-            "search_vector",
-            TSVECTOR,          # TSVECTOR in PG, fallback to String on SQLite
-            nullable=True,
-        ),
+        default=None,
+        sa_column=_search_vector_column,
         repr=False,
-        index=True,
     )
 
     # ——— Relationships ————————————————————————
-    slots: List["Slot"] = Relationship(back_populates="event")
-    reviews: List["Review"] = Relationship(back_populates="event")
+    slots: List["Slot"] = Relationship(
+        back_populates="event",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
+    reviews: List["Review"] = Relationship(
+        back_populates="event",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
+
+    # ——— Convenience props ——————————————————————
+    @property
+    def remaining_slots(self) -> int:
+        """Number of slots that still have at least one free seat."""
+        return sum(1 for slot in self.slots if not slot.is_full)
 
 
 # Forward-declared imports (avoid circular refs at import time)
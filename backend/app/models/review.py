@@ -12,12 +12,12 @@ Event   1─∞  Review
 Booking 1─1  Review   (Booking.review.uselist = False)
 """
 
-from __future__ import annotations
 
 from datetime import datetime
 from uuid import uuid4
 from typing import Optional
 
+from sqlalchemy import Column, ForeignKey, Uuid, func
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -27,20 +27,19 @@ class Review(SQLModel, table=True):
     # ——— Columns ————————————————————————————————————————————
     id: str = Field(
         default_factory=lambda: str(uuid4()),
-        primary_key=True,
-        index=True,
+        sa_column=Column(Uuid(as_uuid=False), primary_key=True, index=True),
     )
 
     event_id: str = Field(
-        foreign_key="event.id",
-        nullable=False,
-        index=True,
+        sa_column=Column(
+            Uuid(as_uuid=False), ForeignKey("event.id"), nullable=False, index=True
+        ),
         description="Parent event UUID",
     )
     booking_id: str = Field(
-        foreign_key="booking.id",
-        nullable=False,
-        index=True,
+        sa_column=Column(
+            Uuid(as_uuid=False), ForeignKey("booking.id"), nullable=False, index=True
+        ),
         description="Booking this review refers to (1-to-1)",
     )
 
@@ -58,6 +57,7 @@ class Review(SQLModel, table=True):
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
         nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
         description="UTC timestamp",
     )
 
@@ -13,13 +13,12 @@ Highlights
   date-time can’t be inserted twice for one event.
 """
 
-from __future__ import annotations
 
 from datetime import datetime
 from typing import List
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint, Uuid, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -36,15 +35,14 @@ class Slot(SQLModel, table=True):
     # ——— Core columns ————————————————————————————
     id: str = Field(
         default_factory=lambda: str(uuid4()),
-        primary_key=True,
-        index=True,
+        sa_column=Column(Uuid(as_uuid=False), primary_key=True, index=True),
     )
 
     # FK → app.models.event.Event
     event_id: str = Field(
-        foreign_key="event.id",
-        nullable=False,
-        index=True,
+        sa_column=Column(
+            Uuid(as_uuid=False), ForeignKey("event.id"), nullable=False, index=True
+        ),
         description="Parent event UUID",
     )
 
@@ -60,26 +58,41 @@ class Slot(SQLModel, table=True):
         description="Capacity for this slot",
     )
 
+    # Denormalised CONFIRMED-booking counter, maintained transactionally
+    # alongside booking inserts/cancels (same pattern as the Event rating
+    # columns).  The conditional increment in services.bookings doubles as
+    # the capacity check, so the hot path never COUNTs booking rows.
+    booked_count: int = Field(
+        default=0,
+        ge=0,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+        description="CONFIRMED bookings currently held against this slot",
+    )
+
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
         nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
         description="UTC row creation time",
     )
 
     # ——— Relationships ——————————————————————————
     event: "Event" = Relationship(back_populates="slots")
-    bookings: List["Booking"] = Relationship(back_populates="slot")
+    bookings: List["Booking"] = Relationship(
+        back_populates="slot",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
 
     # ——— Convenience props ——————————————————————
     @property
     def is_full(self) -> bool:
         """Returns True if the slot has reached max capacity."""
-        return len(self.bookings) >= self.max_bookings
+        return self.booked_count >= self.max_bookings
 
     @property
     def remaining(self) -> int:
         """Number of seats still open (never negative)."""
-        return max(self.max_bookings - len(self.bookings), 0)
+        return max(self.max_bookings - self.booked_count, 0)
 
 
 # ——— Deferred imports to avoid circular refs —————————
@@ -10,9 +10,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, constr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -29,7 +29,12 @@ class BookingStatus(str, Enum):
 # ─────────────────────────────────────────────────────────────────────
 
 class _BookingBase(BaseModel):
-    name: constr(min_length=1, max_length=80)
+    # EmailStr under pydantic-2 is syntax-only (no DNS deliverability
+    # lookup), so validation stays in-process.  Whitespace is stripped so
+    # " a@b.c" and "a@b.c" hit the same uniqueness probe.
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    name: Annotated[str, StringConstraints(min_length=1, max_length=80)]
     email: EmailStr
 
 
@@ -79,5 +84,4 @@ class BookingRead(_BookingBase):
     price_minor: int
     image_url: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -10,9 +10,12 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field, conint, constr, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+PositiveInt = Annotated[int, Field(gt=0)]
+NonNegativeInt = Annotated[int, Field(ge=0)]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -42,12 +45,12 @@ class SlotInput(BaseModel):
     start_utc: datetime = Field(
         ...,
         description="Slot start in UTC (ISO-8601)",
-        example="2025-06-20T10:00:00Z",
+        examples=["2025-06-20T10:00:00Z"],
     )
-    max_bookings: conint(gt=0) = Field(
+    max_bookings: PositiveInt = Field(
         1,
         description="Capacity for this slot",
-        example=5,
+        examples=[5],
     )
 
 
@@ -61,8 +64,7 @@ class SlotRead(BaseModel):
     remaining: int
     is_full: bool
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -74,11 +76,11 @@ class _EventBase(BaseModel):
     title: str = Field(..., max_length=140)
     description: str
     host_name: str
-    category: str = Field(..., example="Design")
-    duration_min: conint(gt=0) = Field(..., example=90)
-    price_minor: conint(ge=0) = Field(..., description="Smallest unit e.g. cents")
+    category: str = Field(..., examples=["Design"])
+    duration_min: PositiveInt = Field(..., examples=[90])
+    price_minor: NonNegativeInt = Field(..., description="Smallest unit e.g. cents")
     currency: Currency = Field(Currency.USD)
-    timezone: str = Field(..., example="America/New_York")
+    timezone: str = Field(..., examples=["America/New_York"])
     image_url: Optional[str] = Field(
         None,
         description="S3 public URL (filled by backend after presign upload)",
@@ -95,7 +97,7 @@ class EventCreate(_EventBase):
 
     slots: List[SlotInput] = Field(
         ...,
-        min_items=1,
+        min_length=1,
         description="List of time slots in UTC",
     )
 
@@ -111,8 +113,8 @@ class EventUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     category: Optional[str] = None
-    duration_min: Optional[conint(gt=0)] = None
-    price_minor: Optional[conint(ge=0)] = None
+    duration_min: Optional[PositiveInt] = None
+    price_minor: Optional[NonNegativeInt] = None
     currency: Optional[Currency] = None
     timezone: Optional[str] = None
     image_url: Optional[str] = None
@@ -131,8 +133,7 @@ class EventCard(_EventBase):
     rating_avg: Optional[float] = None
     rating_count: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ———  outbound / detail view  ———————————————————————————
@@ -146,8 +147,7 @@ class EventDetail(EventCard):
     created_at: datetime
     slots: List[SlotRead]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -167,17 +167,26 @@ class EventFilter(BaseModel):
     FastAPI will turn this into query parameters automatically.
     """
 
-    page: int = Field(1, ge=1)
+    page: int = Field(1, ge=1, description="Legacy offset page; ignored when cursor is set")
     size: int = Field(20, le=100)
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque keyset cursor from the previous response's X-Cursor header",
+    )
+    with_total: bool = Field(
+        False,
+        description="Compute X-Total (adds an aggregate; off by default)",
+    )
     search: Optional[str] = None
     category: Optional[str] = None
     price_min: Optional[int] = Field(None, ge=0)
     price_max: Optional[int] = Field(None, ge=0)
     sort: SortOption = SortOption.recent
 
-    @validator("price_max")
-    def price_range_valid(cls, v, values):
-        if v is not None and values.get("price_min") is not None:
-            if v < values["price_min"]:
+    @field_validator("price_max")
+    @classmethod
+    def price_range_valid(cls, v: Optional[int], info: ValidationInfo):
+        if v is not None and info.data.get("price_min") is not None:
+            if v < info.data["price_min"]:
                 raise ValueError("price_max must be ≥ price_min")
         return v
@@ -13,9 +13,11 @@ All date-times are ISO-8601 in **UTC**.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, conint
+from pydantic import BaseModel, ConfigDict, Field
+
+Rating = Annotated[int, Field(ge=1, le=5)]
 
 
 # ─────────────────────────────
@@ -31,7 +33,7 @@ class ReviewCreate(BaseModel):
     """
 
     booking_id: str = Field(..., description="Booking UUID that grants review rights")
-    rating: conint(ge=1, le=5) = Field(..., description="Stars 1–5")
+    rating: Rating = Field(..., description="Stars 1–5")
     comment: Optional[str] = Field(None, max_length=2_000)
 
 
@@ -41,7 +43,7 @@ class ReviewCreate(BaseModel):
 
 
 class ReviewUpdate(BaseModel):
-    rating: Optional[conint(ge=1, le=5)] = None
+    rating: Optional[Rating] = None
     comment: Optional[str] = Field(None, max_length=2_000)
 
 
@@ -58,5 +60,4 @@ class ReviewRead(BaseModel):
     comment: Optional[str]
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
-from .email import send_email_plain
+from .email import send_email_bulk, send_email_plain
 from .calendar import (generate_ics_bytes, write_ics_to_storage, google_calendar_link)
 
 from .review import (add_review, edit_review, remove_review, event_reviews)
-from .fx import get_rates, convert_minor
\ No newline at end of file
+from .fx import get_rates, convert_minor, convert_minor_batch
\ No newline at end of file
@@ -9,15 +9,15 @@ enforced in a single spot.
 
 from __future__ import annotations
 
-import json
-from typing import Tuple
+from datetime import datetime
+from typing import Optional, Tuple
 
-from fastapi import HTTPException, status
-from sqlmodel import Session
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy import update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.redis import redis_publish
+from app.core.redis import PublishBuffer, redis_publish_async
 from app.crud import (
-    booking_count,
     booking_exists,
     cancel_booking as crud_cancel_booking,
     create_booking as crud_create_booking,
@@ -33,31 +33,50 @@ from app.workers.email import send_booking_email
 # ────────────────────────────────────────────────────────────────
 
 
-def make_booking(
-    session: Session,
+async def make_booking(
+    session: AsyncSession,
     *,
     slot: Slot,
     name: str,
     email: str,
+    bg: Optional[BackgroundTasks] = None,
 ) -> Booking:
     """
     Main entry used by POST /events/{id}/bookings
+
+    Capacity is enforced by a conditional increment of the denormalised
+    ``Slot.booked_count`` counter — one indexed UPDATE that doubles as a
+    row lock, so concurrent bookings can never oversell a slot and the
+    hot path never COUNTs booking rows.  When ``bg`` is given, the Redis
+    broadcast and confirmation e-mail are deferred until after the
+    response is sent, so the client only waits on the DB commit.
     """
     # —— business rules —————————————————————
-    if booking_exists(session, slot.id, email):
+    if await booking_exists(session, slot.id, email):
         raise HTTPException(
             status.HTTP_409_CONFLICT,
             detail="You have already booked this slot.",
         )
 
-    if booking_count(session, slot.id) >= slot.max_bookings:
+    # Claim a seat: matches zero rows when the slot is full.  Rolled back
+    # (with the insert below) if the commit fails, e.g. on a duplicate
+    # race past the probe above.
+    seat = (
+        await session.exec(
+            update(Slot)
+            .where(Slot.id == slot.id, Slot.booked_count < Slot.max_bookings)
+            .values(booked_count=Slot.booked_count + 1)
+            .returning(Slot.booked_count)
+        )
+    ).first()
+    if seat is None:
         raise HTTPException(
             status.HTTP_409_CONFLICT,
             detail="Slot is already full.",
         )
 
     # —— persist ——————————————————————————————
-    booking = crud_create_booking(
+    booking = await crud_create_booking(
         session,
         slot_id=slot.id,
         name=name,
@@ -65,47 +84,217 @@ def make_booking(
     )
 
     # —— side-effects (fire-and-forget) ——————————
-    send_booking_email.delay(booking.id)
-    _broadcast_slot_update(slot)
+    # Payload is computed now, while the session is open; the publish and
+    # e-mail enqueue themselves run post-response when bg is available.
+    channel, message = _slot_update_message(booking.slot)  # freshly re-loaded → counts current
+    if bg is not None:
+        pub = PublishBuffer()
+        pub.append(channel, message)
+        bg.add_task(send_booking_email.delay, booking.id)
+        bg.add_task(pub.flush)  # one pipelined batch however many channels
+    else:  # non-HTTP callers (scripts, workers) keep the inline behaviour
+        send_booking_email.delay(booking.id)
+        await redis_publish_async(channel, message)
 
     return booking
 
 
-def cancel_booking(
-    session: Session,
+async def cancel_booking(
+    session: AsyncSession,
     *,
-    booking: Booking,
+    booking_id: str,
+    bg: Optional[BackgroundTasks] = None,
 ) -> Booking:
     """
     PATCH /bookings/{id} (caller has verified ownership / auth).
+
+    Hot path is one atomic UPDATE … RETURNING; only when that matches
+    nothing do we spend a SELECT to tell 404 from a double cancel.
     """
-    if booking.status == BookingStatus.CANCELLED:
+    booking = await crud_cancel_booking(session, booking_id)
+    if booking is None:
+        existing = await get_booking(session, booking_id)
+        if existing is None:
+            raise HTTPException(
+                status.HTTP_404_NOT_FOUND,
+                detail="Booking not found",
+            )
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
             detail="Booking already cancelled.",
         )
 
-    booking = crud_cancel_booking(session, booking)
+    # retire the worker-side cache so tasks see the new status
+    try:
+        from app.core.redis import redis_async
 
-    # rebroadcast remaining seats
-    _broadcast_slot_update(booking.slot)
+        await redis_async.delete(f"booking:{booking_id}")
+    except Exception:  # pragma: no cover — cache entry expires on its own
+        pass
+
+    # rebroadcast remaining seats (deferred when bg is available)
+    channel, message = _slot_update_message(booking.slot)
+    if bg is not None:
+        pub = PublishBuffer()
+        pub.append(channel, message)
+        bg.add_task(pub.flush)
+    else:
+        await redis_publish_async(channel, message)
     return booking
 
 
-def user_bookings(
-    session: Session,
+async def user_bookings(
+    session: AsyncSession,
     *,
     email: str,
     page: int = 1,
     size: int = 50,
-) -> Tuple[list[Booking], int]:
+    cursor: Optional[Tuple[datetime, str]] = None,
+    with_total: bool = False,
+) -> Tuple[list[Booking], Optional[Tuple[datetime, str]], Optional[int]]:
     """
     Thin wrapper around crud.list_user_bookings so future
     transforms (e.g. masking e-mail) go here once.
     """
     from app.crud import list_user_bookings  # local import avoids cycles
 
-    return list_user_bookings(session, email=email, page=page, size=size)
+    return await list_user_bookings(
+        session,
+        email=email,
+        page=page,
+        size=size,
+        cursor=cursor,
+        with_total=with_total,
+    )
+
+
+# ────────────────────────────────────────────────────────────────
+# Worker-side loader (sync, Redis-cached)
+# ────────────────────────────────────────────────────────────────
+
+_BOOKING_CACHE_TTL = 120  # seconds
+
+
+def load_booking(
+    booking_id: str,
+    *,
+    status: Optional[BookingStatus] = None,
+) -> Optional[Booking]:
+    """Load a booking with slot + event for worker tasks, Redis-cached.
+
+    Email and calendar tasks often fire for the same booking within
+    seconds of each other on different workers; a short-TTL cache of the
+    joined payload under ``booking:{id}`` means the second task costs one
+    Redis GET instead of repeating the join-loaded SELECT.  Cancellation
+    deletes the key so workers never act on a stale CONFIRMED status.
+
+    ``status`` pushes the filter into the SQL WHERE on a miss (a
+    cancelled booking short-circuits before the joined tree is loaded);
+    on a hit it is checked against the cached payload in-memory.
+
+    Returned instances are detached (or rebuilt from the cached payload)
+    and carry only the fields the tasks read — never hand them to a
+    session.
+    """
+    import orjson
+    from sqlmodel import select
+
+    from app.core.database import get_session
+    from app.core.redis import redis_conn
+    from app.models.event import Event
+
+    key = f"booking:{booking_id}"
+    try:
+        cached = redis_conn.get(key)
+    except Exception:  # pragma: no cover — Redis down: straight to SQL
+        cached = None
+    if cached:
+        payload = orjson.loads(cached)
+        if status is not None and payload["booking"]["status"] != status.value:
+            return None
+        return _booking_from_payload(payload)
+
+    # Column projection over two INNER JOINs: one statement, one row,
+    # exactly the fields the tasks read — no selectinload fan-out (three
+    # SELECTs) and no full-row ORM hydration.
+    with get_session() as session:
+        stmt = (
+            select(
+                Booking.id,
+                Booking.slot_id,
+                Booking.name,
+                Booking.email,
+                Booking.status,
+                Slot.event_id,
+                Slot.start_utc,
+                Event.title,
+                Event.description,
+                Event.duration_min,
+                Event.host_name,
+            )
+            .join(Slot, Slot.id == Booking.slot_id)
+            .join(Event, Event.id == Slot.event_id)
+            .where(Booking.id == booking_id)
+        )
+        if status is not None:
+            stmt = stmt.where(Booking.status == status)
+        row = session.exec(stmt).first()
+
+    if row is None:
+        return None
+
+    payload = {
+        "booking": {
+            "id": row[0],
+            "slot_id": row[1],
+            "name": row[2],
+            "email": row[3],
+            "status": BookingStatus(row[4]).value,
+        },
+        "slot": {
+            "id": row[1],
+            "event_id": row[5],
+            "start_utc": row[6],
+        },
+        "event": {
+            "id": row[5],
+            "title": row[7],
+            "description": row[8],
+            "duration_min": row[9],
+            "host_name": row[10],
+        },
+    }
+    try:
+        redis_conn.setex(key, _BOOKING_CACHE_TTL, orjson.dumps(payload))
+    except Exception:  # pragma: no cover
+        pass
+    return _booking_from_payload(payload)
+
+
+def _booking_from_payload(payload: dict) -> Booking:
+    """Rebuild a detached Booking→Slot→Event chain from the cached dict."""
+    from app.models.event import Event
+
+    b, s, e = payload["booking"], payload["slot"], payload["event"]
+    start_utc = s["start_utc"]
+    if isinstance(start_utc, str):  # came through orjson, not straight from SQL
+        start_utc = datetime.fromisoformat(start_utc)
+    event = Event(**e)
+    slot = Slot(
+        id=s["id"],
+        event_id=s["event_id"],
+        start_utc=start_utc,
+    )
+    slot.event = event
+    booking = Booking(
+        id=b["id"],
+        slot_id=b["slot_id"],
+        name=b["name"],
+        email=b["email"],
+        status=BookingStatus(b["status"]),
+    )
+    booking.slot = slot
+    return booking
 
 
 # ────────────────────────────────────────────────────────────────
@@ -113,15 +302,20 @@ def user_bookings(
 # ────────────────────────────────────────────────────────────────
 
 
-def _broadcast_slot_update(slot: Slot) -> None:
+def _slot_update_message(slot: Slot) -> Tuple[str, dict]:
     """
-    Publishes `{slot_id, remaining}` to Redis channel
+    Builds the `{slot_id, remaining}` payload for Redis channel
     `event:{event_id}` so WebSocket clients refresh UI.
+
+    Returned as ``(channel, payload)`` so callers can hand the publish to
+    a background task — the slot's counts are read here, while the ORM
+    state is still loaded, not at publish time.  The payload stays a
+    plain dict: the Redis helpers encode it with orjson at publish time,
+    keeping the JSON encode off the stdlib path.
     """
     payload = {
         "slot_id": slot.id,
         "remaining": slot.remaining,
         "is_full": slot.is_full,
     }
-    channel = f"event:{slot.event_id}"
-    redis_publish(channel, json.dumps(payload))
+    return f"event:{slot.event_id}", payload
@@ -8,11 +8,16 @@ This module converts Booking objects into:
 2.  A Google-Calendar “quick-add” link
 3.  Helpers for mocked push-sync webhooks (no real OAuth)
 
-The heavy lifting is done with the lightweight *icalendar* library.
+The .ics payload is emitted directly as CRLF-joined bytes — the format
+is trivial line-oriented text, and skipping the *icalendar* object model
+(vText/vDatetime wrappers, per-property re-escaping) keeps the build at
+string speed.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import tempfile
 import urllib.parse
@@ -21,12 +26,8 @@ from pathlib import Path
 from typing import Literal, Tuple
 from uuid import uuid4
 
-try:
-    from icalendar import Calendar, Event as ICalEvent
-except ModuleNotFoundError:  # pragma: no cover
-    raise RuntimeError("pip install icalendar")
-
 from app.core.config import settings
+from app.core.redis import redis_conn
 from app.models.booking import Booking
 
 log = logging.getLogger(__name__)
@@ -36,6 +37,41 @@ log = logging.getLogger(__name__)
 # --------------------------------------------------------------------------------------------------
 
 
+def _gcal_fmt(dt: datetime) -> str:
+    """UTC basic-format timestamp (YYYYMMDDTHHMMSSZ) without strftime's
+    per-call format parsing — plain f-string field formatting."""
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+        f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+    )
+
+
+def _ics_escape(value: str) -> str:
+    """Escape TEXT per RFC 5545 (backslash first, then , ; and newlines)."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def ics_content_hash(booking: Booking) -> str:
+    """Digest of the editable fields that feed the .ics payload.
+
+    There is no ``updated_at`` column to version caches on, so keys
+    embed this hash instead: an event edit changes it, moving readers
+    to a fresh entry while the stale one ages out on its TTL.
+    """
+    slot = booking.slot
+    event = slot.event
+    return hashlib.blake2b(
+        f"{slot.start_utc}{event.title}{event.duration_min}{booking.email}".encode(),
+        digest_size=8,
+    ).hexdigest()
+
+
 def generate_ics_bytes(booking: Booking) -> bytes:
     """
     Convert a Booking row → raw .ics bytes.
@@ -47,22 +83,23 @@ def generate_ics_bytes(booking: Booking) -> bytes:
     start = booking.slot.start_utc.replace(tzinfo=timezone.utc)
     end = start + timedelta(minutes=event.duration_min)
 
-    cal = Calendar()
-    cal.add("prodid", "-//Scheduler//example.com//")
-    cal.add("version", "2.0")
-
-    ev = ICalEvent()
-    ev.add("uid", f"{booking.id}@scheduler.local")
-    ev.add("dtstamp", datetime.utcnow().replace(tzinfo=timezone.utc))
-    ev.add("dtstart", start)
-    ev.add("dtend", end)
-    ev.add("summary", event.title)
-    ev.add("description", event.description)
-    ev.add("location", "Online")
-    ev.add("organizer", f"MAILTO:{settings.EMAIL_FROM}")
-
-    cal.add_component(ev)
-    return cal.to_ical()
+    lines = [
+        b"BEGIN:VCALENDAR",
+        b"VERSION:2.0",
+        b"PRODID:-//Scheduler//example.com//",
+        b"BEGIN:VEVENT",
+        f"UID:{booking.id}@scheduler.local".encode(),
+        f"DTSTAMP:{_gcal_fmt(datetime.utcnow())}".encode(),
+        f"DTSTART:{_gcal_fmt(start)}".encode(),
+        f"DTEND:{_gcal_fmt(end)}".encode(),
+        f"SUMMARY:{_ics_escape(event.title)}".encode(),
+        f"DESCRIPTION:{_ics_escape(event.description)}".encode(),
+        b"LOCATION:Online",
+        f"ORGANIZER:MAILTO:{settings.EMAIL_FROM}".encode(),
+        b"END:VEVENT",
+        b"END:VCALENDAR",
+    ]
+    return b"\r\n".join(lines) + b"\r\n"
 
 
 def write_ics_to_storage(
@@ -113,30 +150,43 @@ def write_ics_to_storage(
         raise ValueError("mode must be 'temp' or 's3'")
 
 
-def google_calendar_link(booking: Booking) -> str:
+@functools.lru_cache(maxsize=2048)
+def _gcal_link_for_slot(
+    slot_id: str, title: str, description: str, dates: str
+) -> str:
     """
-    Build a Google Calendar **quick-add** URL.
+    URL-encode the quick-add query once per slot.
 
-    Docs:
-    https://developers.google.com/calendar/api/guides/create-events-quickadd
+    ``slot_id`` keys the memo; title/description/dates are invariant per
+    slot, so repeat attendees skip the urlencode over the (potentially
+    long) description entirely.
     """
-    event = booking.slot.event
-    start = booking.slot.start_utc.strftime("%Y%m%dT%H%M%SZ")
-    end = (
-        booking.slot.start_utc + timedelta(minutes=event.duration_min)
-    ).strftime("%Y%m%dT%H%M%SZ")
-
     query = {
         "action": "TEMPLATE",
-        "text": event.title,
-        "details": event.description,
-        "dates": f"{start}/{end}",
+        "text": title,
+        "details": description,
+        "dates": dates,
         "location": "Online",
         "trp": "false",
     }
     return f"https://www.google.com/calendar/render?{urllib.parse.urlencode(query)}"
 
 
+def google_calendar_link(booking: Booking) -> str:
+    """
+    Build a Google Calendar **quick-add** URL.
+
+    Docs:
+    https://developers.google.com/calendar/api/guides/create-events-quickadd
+    """
+    event = booking.slot.event
+    start = _gcal_fmt(booking.slot.start_utc)
+    end = _gcal_fmt(booking.slot.start_utc + timedelta(minutes=event.duration_min))
+    return _gcal_link_for_slot(
+        booking.slot_id, event.title, event.description, f"{start}/{end}"
+    )
+
+
 # --------------------------------------------------------------------------------------------------
 # Mocked webhook handler (optional)
 # --------------------------------------------------------------------------------------------------
@@ -159,6 +209,29 @@ def handle_google_webhook(payload: dict) -> None:
 def upload_ics_and_return_url(booking: Booking) -> str:
     """
     Handy for Celery worker: upload to S3 (if configured) else temp file.
+
+    The URL is cached in Redis per *slot*: every attendee of a slot gets
+    byte-identical content apart from the UID, so one build + upload
+    serves them all (calendar clients are fine with a shared UID).  A
+    content hash over the fields that feed the file rides in the key —
+    same pattern as the worker-side ics cache — so an event edit moves
+    callers to a fresh key instead of serving the pre-edit file for the
+    rest of the TTL (there is no updated_at column to version on).
+    Redis being down just means we regenerate — never an error.
     """
+    cache_key = f"ics:{booking.slot_id}:{ics_content_hash(booking)}"
+    try:
+        cached = redis_conn.get(cache_key)
+        if cached:
+            return cached
+    except Exception:  # noqa: BLE001
+        log.warning("ICS cache read failed; regenerating")
+
     mode = "s3" if settings.S3_ACCESS_KEY and settings.S3_SECRET_KEY else "temp"
-    return write_ics_to_storage(booking, mode=mode)
+    url = write_ics_to_storage(booking, mode=mode)
+
+    try:
+        redis_conn.setex(cache_key, 86400, url)
+    except Exception:  # noqa: BLE001
+        pass
+    return url
@@ -19,8 +19,13 @@ send_email_plain(
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import queue
+import smtplib
 import textwrap
+from email.mime.text import MIMEText
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
 import httpx
@@ -64,6 +69,8 @@ def send_email_plain(
         _send_console(to, subject, body)
     elif backend == "ses":
         _send_ses(to, subject, body, reply_to, cc, bcc)
+    elif backend == "ses_smtp":
+        _send_ses_smtp(to, subject, body, reply_to, cc, bcc)
     elif backend == "sendgrid":
         _send_sendgrid(to, subject, body, reply_to, cc, bcc)
     else:  # pragma: no cover
@@ -71,11 +78,51 @@ def send_email_plain(
         _send_console(to, subject, body)
 
 
+def send_email_bulk(
+    *,
+    recipients: Sequence[str],
+    subject: str,
+    body: str,
+) -> None:
+    """
+    Fan one identical message out to many recipients in as few transport
+    calls as possible (event reminders, digest mails).
+
+    * sendgrid – one API request per 1000 recipients (personalizations)
+    * ses      – one API call per 50 recipients (SES destination limit),
+                 addressed via BCC so recipients stay hidden
+    * ses_smtp – one DATA exchange per 50 recipients over the pooled TLS
+                 sessions, likewise BCC-addressed
+    * console  – single log line
+
+    Same no-raise contract as :func:`send_email_plain`.
+    """
+    if not recipients:
+        return
+    backend = settings.EMAIL_BACKEND.lower()
+
+    if backend == "sendgrid":
+        _send_sendgrid_bulk(recipients, subject, body)
+    elif backend == "ses":
+        for chunk in _chunked(recipients, 50):
+            _send_ses([settings.EMAIL_FROM], subject, body, None, None, chunk)
+    elif backend == "ses_smtp":
+        for chunk in _chunked(recipients, 50):
+            _send_ses_smtp([settings.EMAIL_FROM], subject, body, None, None, chunk)
+    else:
+        _send_console(recipients, subject, body)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Concrete back-ends
 # ──────────────────────────────────────────────────────────────────────
 
 
+def _chunked(seq: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
+
 def _send_console(to: Iterable[str], subject: str, body: str) -> None:
     log.info(
         "\n==== Console e-mail ====\nTo: %s\nSubj: %s\n\n%s\n========================",
@@ -88,6 +135,26 @@ def _send_console(to: Iterable[str], subject: str, body: str) -> None:
 # ——— AWS SES ————————————————————————————————————————————————
 
 
+@lru_cache(maxsize=1)
+def _ses_client():
+    """
+    One SES client per process: credential resolution, endpoint discovery
+    and the TLS handshake happen once, and the underlying urllib3 pool is
+    reused across sends.  Pool sized for the gevent worker concurrency;
+    adaptive retries smooth over SES throttling during bursts.
+    """
+    from botocore.config import Config
+
+    return boto3.client(
+        "ses",
+        region_name=settings.SES_REGION,
+        config=Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        ),
+    )
+
+
 def _send_ses(
     to: Sequence[str],
     subject: str,
@@ -101,7 +168,7 @@ def _send_ses(
         return
 
     try:
-        ses = boto3.client("ses", region_name=settings.SES_REGION)
+        ses = _ses_client()
         ses.send_email(
             Source=settings.EMAIL_FROM,
             Destination={
@@ -120,9 +187,111 @@ def _send_ses(
         log.exception("SES send_email failed: %s", exc)
 
 
+# ——— AWS SES over SMTP (pooled persistent connections) ————————
+
+
+_SMTP_POOL_SIZE = 8
+_smtp_pool: "queue.Queue[smtplib.SMTP_SSL]" = queue.Queue(maxsize=_SMTP_POOL_SIZE)
+
+
+@contextlib.contextmanager
+def _ses_smtp_connection():
+    """
+    Check a live SMTP_SSL session out of a bounded pool.
+
+    The SES HTTP API costs a request per message; over SMTP many
+    MAIL FROM/RCPT TO/DATA exchanges ride one TLS session, so senders
+    skip the ~3-RTT TCP+TLS+AUTH handshake per e-mail.  A Queue (rather
+    than a thread-local) shares at most ``_SMTP_POOL_SIZE`` sessions
+    across the hundreds of gevent greenlets in a worker, where
+    thread-locals would be per-greenlet and open one connection each.
+    A NOOP probes liveness; sessions are dropped on any send error.
+    """
+    conn = None
+    try:
+        conn = _smtp_pool.get_nowait()
+        try:
+            conn.noop()
+        except Exception:
+            with contextlib.suppress(Exception):
+                conn.close()
+            conn = None
+    except queue.Empty:
+        pass
+    if conn is None:
+        conn = smtplib.SMTP_SSL(f"email-smtp.{settings.SES_REGION}.amazonaws.com", 465)
+        conn.login(settings.SES_SMTP_USER, settings.SES_SMTP_PASSWORD)
+    try:
+        yield conn
+    except Exception:
+        with contextlib.suppress(Exception):
+            conn.close()
+        raise
+    else:
+        try:
+            _smtp_pool.put_nowait(conn)
+        except queue.Full:
+            with contextlib.suppress(Exception):
+                conn.close()
+
+
+def _send_ses_smtp(
+    to: Sequence[str],
+    subject: str,
+    body: str,
+    reply_to: str | None,
+    cc: Sequence[str] | None,
+    bcc: Sequence[str] | None,
+) -> None:
+    if not (settings.SES_REGION and settings.SES_SMTP_USER and settings.SES_SMTP_PASSWORD):
+        log.error("SES SMTP credentials missing – cannot send mail")
+        return
+
+    msg = MIMEText(body, "plain", "utf-8")
+    msg["Subject"] = subject
+    msg["From"] = settings.EMAIL_FROM
+    msg["To"] = ", ".join(to)
+    if cc:
+        msg["Cc"] = ", ".join(cc)
+    if reply_to:
+        msg["Reply-To"] = reply_to
+    recipients = [*to, *(cc or []), *(bcc or [])]
+
+    try:
+        with _ses_smtp_connection() as conn:
+            conn.sendmail(settings.EMAIL_FROM, recipients, msg.as_string())
+        log.debug("SES SMTP e-mail sent to %s", to)
+    except Exception:  # pragma: no cover
+        log.exception("SES SMTP send failed")
+
+
 # ——— SendGrid (thin HTTP client, no heavy SDK) ————————————————
 
 
+@lru_cache(maxsize=1)
+def _sendgrid_client() -> httpx.Client:
+    """
+    One keep-alive client per process: TCP + TLS are amortised over many
+    sends instead of a fresh handshake per e-mail.  The auth header lives
+    on the client, so payload assembly is the only per-call cost.
+    (HTTP/2 deliberately not enabled — it would pull in the optional h2
+    dependency for no win on a request/response workload.)
+    """
+    return httpx.Client(
+        base_url="https://api.sendgrid.com",
+        timeout=10,
+        headers={
+            "Authorization": f"Bearer {settings.SENDGRID_API_KEY}",
+            "Content-Type": "application/json",
+        },
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30,
+        ),
+    )
+
+
 def _send_sendgrid(
     to: Sequence[str],
     subject: str,
@@ -135,20 +304,16 @@ def _send_sendgrid(
         log.error("SENDGRID_API_KEY missing – cannot send mail")
         return
 
-    api_url = "https://api.sendgrid.com/v3/mail/send"
-    headers = {
-        "Authorization": f"Bearer {settings.SENDGRID_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    # Optional keys are added only when present — the API rejects nulls,
+    # and building-then-filtering would allocate a throwaway dict per send.
+    personalization: dict = {"to": [{"email": addr} for addr in to]}
+    if cc:
+        personalization["cc"] = [{"email": addr} for addr in cc]
+    if bcc:
+        personalization["bcc"] = [{"email": addr} for addr in bcc]
 
     payload = {
-        "personalizations": [
-            {
-                "to": [{"email": addr} for addr in to],
-                "cc": [{"email": addr} for addr in (cc or [])] or None,
-                "bcc": [{"email": addr} for addr in (bcc or [])] or None,
-            }
-        ],
+        "personalizations": [personalization],
         "from": {"email": settings.EMAIL_FROM},
         "subject": subject,
         "content": [{"type": "text/plain", "value": body}],
@@ -156,14 +321,38 @@ def _send_sendgrid(
     if reply_to:
         payload["reply_to"] = {"email": reply_to}
 
-    # Remove None keys the API dislikes
-    payload = {k: v for k, v in payload.items() if v is not None}
-
     try:
-        resp = httpx.post(api_url, json=payload, headers=headers, timeout=10)
+        resp = _sendgrid_client().post("/v3/mail/send", json=payload)
         if resp.status_code >= 400:  # pragma: no cover
             log.error("SendGrid error %s – %s", resp.status_code, resp.text)
         else:
             log.debug("SendGrid e-mail accepted for %s", to)
     except Exception:  # pragma: no cover
         log.exception("SendGrid HTTP call failed")
+
+
+def _send_sendgrid_bulk(recipients: Sequence[str], subject: str, body: str) -> None:
+    """
+    One request per 1000 recipients: the v3 API takes up to 1000
+    personalizations, so N individual sends collapse into ceil(N/1000)
+    round trips over the pooled client.
+    """
+    if not settings.SENDGRID_API_KEY:
+        log.error("SENDGRID_API_KEY missing – cannot send mail")
+        return
+
+    for chunk in _chunked(recipients, 1000):
+        payload = {
+            "personalizations": [{"to": [{"email": addr}]} for addr in chunk],
+            "from": {"email": settings.EMAIL_FROM},
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": body}],
+        }
+        try:
+            resp = _sendgrid_client().post("/v3/mail/send", json=payload)
+            if resp.status_code >= 400:  # pragma: no cover
+                log.error("SendGrid bulk error %s – %s", resp.status_code, resp.text)
+            else:
+                log.debug("SendGrid bulk accepted for %d recipients", len(chunk))
+        except Exception:  # pragma: no cover
+            log.exception("SendGrid bulk HTTP call failed")
@@ -12,12 +12,15 @@ Usage (inside FastAPI route):
     eur_cents = convert_minor(4500, "USD", "EUR", rates)
 """
 
-import json
 import logging
+import os
+import random
+import time
 from datetime import timedelta
-from typing import Dict, Mapping
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 
 from app.core.config import settings
 from app.core.redis import redis_conn  # global connection from earlier helper
@@ -25,6 +28,25 @@ from app.core.redis import redis_conn  # global connection from earlier helper
 log = logging.getLogger(__name__)
 
 REDIS_KEY = "fx:rates"
+STALE_KEY = "fx:rates:stale"   # last good payload, no TTL (stale-on-error)
+FETCHED_AT_KEY = "fx:rates:fetched_at"  # unix ts of last successful fetch
+REFRESHING_KEY = "fx:rates:refreshing"  # SETNX flag: one background refresh
+LOCK_KEY = "fx:rates:lock"
+_LOCK_TTL_MS = 15_000          # auto-expiry guards against a dead winner
+_LOCK_WAIT_S = 2.0             # how long losers poll before self-serving
+_SWR_TTL = 3600.0              # grace window: serve stale, refresh off-path
+
+# Compare-and-delete so only the lock's owner releases it.
+_UNLOCK_LUA = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) end"
+)
+
+# Process-local memo in front of Redis: rate tables barely move intraday,
+# so pages that convert 20+ prices shouldn't pay 20 Redis round trips.
+# Redis stays the cross-worker source of truth with the long TTL.
+_LOCAL_TTL = 600.0  # seconds
+_local_cache: dict = {"rates": None, "exp": 0.0}
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -33,24 +55,125 @@ REDIS_KEY = "fx:rates"
 def get_rates(force_refresh: bool = False) -> Mapping[str, float]:
     """Return dict like `{ 'USD': 1.0, 'EUR': 0.93, … }`.
 
-    Cached in Redis with TTL = `settings.FX_REFRESH_HOURS`.
+    Two cache layers: a 10-minute in-process memo (no I/O at all), then
+    Redis with TTL = `settings.FX_REFRESH_HOURS`.
     """
+    now = time.monotonic()
+    if not force_refresh and _local_cache["exp"] > now:
+        return _local_cache["rates"]
+
     if not force_refresh:
+        cached = _read_cache()
+        if cached is not None:
+            _local_cache.update(rates=cached, exp=now + _LOCAL_TTL)
+            return cached
+
+        # Stale-while-revalidate: just past expiry, hand back the last
+        # good table immediately and let a worker refresh off-path — the
+        # request never waits on the FX provider.  Only a table older
+        # than the grace window (or a missing one) blocks below.
+        stale, age = _read_stale()
+        if stale is not None and age is not None:
+            if age < settings.FX_REFRESH_HOURS * 3600 + _SWR_TTL:
+                _schedule_refresh()
+                # Short memo: the refreshed table should land within a
+                # minute, so don't pin the stale one for the full TTL.
+                _local_cache.update(rates=stale, exp=now + 60.0)
+                return stale
+
+    # Single-flight: when the key expires under load, only one caller
+    # should hit the remote API; the rest wait briefly for its result.
+    token = os.urandom(8).hex()
+    try:
+        acquired = bool(redis_conn.set(LOCK_KEY, token, nx=True, px=_LOCK_TTL_MS))
+    except Exception:  # pragma: no cover — Redis down: everyone fetches
+        acquired = True
+
+    if not acquired and not force_refresh:
+        deadline = time.monotonic() + _LOCK_WAIT_S
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            cached = _read_cache()
+            if cached is not None:
+                _local_cache.update(rates=cached, exp=time.monotonic() + _LOCAL_TTL)
+                return cached
+        # Winner died or is slow — fall through and fetch ourselves.
+
+    fetched = True
+    try:
         try:
-            cached = redis_conn.get(REDIS_KEY)
-            if cached:
-                return json.loads(cached)
-        except Exception:  # pragma: no cover
-            log.exception("FX cache read failed")
+            rates = _fetch_rates_remote()
+        except Exception:  # pragma: no cover — provider down / bad payload
+            # Serve the last good table (un-TTL'd copy) without touching
+            # the cache keys: writing a failure as "fresh" would reset the
+            # stale-age clock on every attempt and make the SWR rot
+            # threshold unreachable for the whole outage.
+            fetched = False
+            log.exception("FX fetch failed — serving last good table uncached")
+            stale, _ = _read_stale()
+            rates = stale if stale is not None else {"USD": 1.0}
+        if fetched:
+            try:
+                # ±10% jitter de-synchronises expiry across workers that
+                # all populated their cache at the same boot.
+                base_ttl = settings.FX_REFRESH_HOURS * 3600
+                ttl = int(base_ttl * (1 + random.uniform(-0.1, 0.1)))
+                payload = orjson.dumps(rates)
+                # One round-trip for all three keys
+                with redis_conn.pipeline(transaction=False) as pipe:
+                    pipe.setex(REDIS_KEY, ttl, payload)
+                    pipe.set(STALE_KEY, payload)
+                    pipe.set(FETCHED_AT_KEY, int(time.time()))
+                    pipe.execute()
+            except Exception:  # pragma: no cover
+                log.exception("FX cache write failed")
+    finally:
+        if acquired:
+            try:
+                redis_conn.eval(_UNLOCK_LUA, 1, LOCK_KEY, token)
+            except Exception:  # pragma: no cover
+                pass
+
+    # A fallback table is memoised only briefly so the next caller retries
+    # the provider instead of pinning stale (or placeholder) rates.
+    memo_ttl = _LOCAL_TTL if fetched else 60.0
+    _local_cache.update(rates=rates, exp=time.monotonic() + memo_ttl)
+    return rates
+
 
-    rates = _fetch_rates_remote()
+def _read_cache() -> Optional[Dict[str, float]]:
+    """Redis read that treats any failure as a miss."""
     try:
-        ttl = settings.FX_REFRESH_HOURS * 3600
-        redis_conn.setex(REDIS_KEY, ttl, json.dumps(rates))
+        cached = redis_conn.get(REDIS_KEY)
     except Exception:  # pragma: no cover
-        log.exception("FX cache write failed")
+        log.exception("FX cache read failed")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+def _read_stale() -> Tuple[Optional[Dict[str, float]], Optional[float]]:
+    """Return ``(last good table, its age in seconds)`` — misses as None."""
+    try:
+        with redis_conn.pipeline(transaction=False) as pipe:
+            pipe.get(STALE_KEY)
+            pipe.get(FETCHED_AT_KEY)
+            stale, fetched_at = pipe.execute()
+    except Exception:  # pragma: no cover
+        return None, None
+    if not stale or not fetched_at:
+        return None, None
+    return orjson.loads(stale), time.time() - int(fetched_at)
 
-    return rates
+
+def _schedule_refresh() -> None:
+    """Enqueue one fx.refresh_rates across the cluster (SETNX-guarded)."""
+    try:
+        if redis_conn.set(REFRESHING_KEY, "1", nx=True, ex=60):
+            from app.core.celery_app import celery_app  # local: avoid cycle
+
+            celery_app.send_task("fx.refresh_rates", queue="analytics")
+    except Exception:  # pragma: no cover — broker down: next caller retries
+        log.debug("FX background refresh scheduling failed", exc_info=True)
 
 
 def convert_minor(amount_minor: int, from_currency: str, to_currency: str, rates: Mapping[str, float]) -> int:
@@ -68,18 +191,49 @@ def convert_minor(amount_minor: int, from_currency: str, to_currency: str, rates
 
     return int(round(amount_minor * base_ratio))
 
+
+def convert_minor_batch(
+    amounts_minor: Sequence[int],
+    from_codes: Sequence[str],
+    to_codes: Sequence[str],
+    rates: Mapping[str, float],
+) -> List[int]:
+    """Convert many minor-unit amounts in one pass (cart / invoice lines).
+
+    Hoists the per-pair ratio out of the loop: carts usually mix only a
+    couple of currency pairs, so each ratio (two dict lookups + a divide)
+    is computed once and reused instead of per line item.
+    """
+    if not (len(amounts_minor) == len(from_codes) == len(to_codes)):
+        raise ValueError("amounts, from_codes and to_codes must be the same length")
+
+    ratios: Dict[tuple, float] = {}
+    out: List[int] = []
+    for amount, frm, to in zip(amounts_minor, from_codes, to_codes):
+        if frm == to:
+            out.append(amount)
+            continue
+        ratio = ratios.get((frm, to))
+        if ratio is None:
+            try:
+                ratio = rates[to] / rates[frm]
+            except KeyError as exc:
+                raise ValueError(f"Missing FX rate for {exc.args[0]}") from exc
+            ratios[(frm, to)] = ratio
+        out.append(int(round(amount * ratio)))
+    return out
+
 # ---------------------------------------------------------------------------
 # Internal
 # ---------------------------------------------------------------------------
 
 def _fetch_rates_remote() -> Dict[str, float]:
-    """Hit exchangerate.host (or custom URL) and return rate dict."""
-    try:
-        resp = httpx.get(settings.FX_API_URL, params={"base": "USD"}, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        return data["rates"]  # type: ignore[name-defined]
-    except Exception as exc:  # pragma: no cover
-        log.exception("Failed to fetch FX rates: %s", exc)
-        # Fallback to USD 1.0 only – avoids crash, conversions become no‑ops
-        return {"USD": 1.0}
+    """Hit exchangerate.host (or custom URL) and return the rate dict.
+
+    Raises on any transport or payload error — the caller decides what a
+    failure means (serve stale, skip the cache write); swallowing it here
+    would let a failed fetch masquerade as a fresh table.
+    """
+    resp = httpx.get(str(settings.FX_API_URL), params={"base": "USD"}, timeout=10)
+    resp.raise_for_status()
+    return resp.json()["rates"]
@@ -1,5 +1,3 @@
-from app.crud import recompute_event_rating
-recompute_event_rating(session, event_id=review.event_id)
 from __future__ import annotations
 
 """Domain logic for Reviews
@@ -15,7 +13,7 @@ from datetime import datetime
 from typing import Tuple, List, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud import (
     review_exists,
@@ -32,8 +30,8 @@ from app.models.review import Review
 # Creation
 # ---------------------------------------------------------------------------
 
-def add_review(
-    session: Session,
+async def add_review(
+    session: AsyncSession,
     *,
     booking: Booking,
     rating: int,
@@ -47,7 +45,7 @@ def add_review(
             detail="Cannot review an unconfirmed booking.",
         )
 
-    if review_exists(session, booking_id=booking.id):
+    if await review_exists(session, booking_id=booking.id):
         raise HTTPException(
             status.HTTP_409_CONFLICT,
             detail="This booking already has a review.",
@@ -58,7 +56,7 @@ def add_review(
     # if booking.slot.start_utc > now:
     #     raise HTTPException(400, "You can only review after the event has occurred.")
 
-    return crud_create_review(
+    return await crud_create_review(
         session,
         event_id=booking.slot.event_id,
         booking_id=booking.id,
@@ -71,22 +69,31 @@ def add_review(
 # Listing (with pagination)
 # ---------------------------------------------------------------------------
 
-def event_reviews(
-    session: Session,
+async def event_reviews(
+    session: AsyncSession,
     *,
     event_id: str,
     page: int = 1,
     size: int = 20,
-) -> Tuple[List[Review], int]:
-    return crud_list_reviews(session, event_id=event_id, page=page, size=size)
+    cursor: Optional[Tuple[datetime, str]] = None,
+    with_total: bool = False,
+) -> Tuple[List[Review], Optional[Tuple[datetime, str]], Optional[int]]:
+    return await crud_list_reviews(
+        session,
+        event_id=event_id,
+        page=page,
+        size=size,
+        cursor=cursor,
+        with_total=with_total,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Update
 # ---------------------------------------------------------------------------
 
-def edit_review(
-    session: Session,
+async def edit_review(
+    session: AsyncSession,
     *,
     review: Review,
     rating: Optional[int] = None,
@@ -95,12 +102,12 @@ def edit_review(
     if rating is None and comment is None:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="No changes supplied.")
 
-    return crud_update_review(session, review, rating=rating, comment=comment)
+    return await crud_update_review(session, review, rating=rating, comment=comment)
 
 
 # ---------------------------------------------------------------------------
 # Delete
 # ---------------------------------------------------------------------------
 
-def remove_review(session: Session, *, review: Review) -> None:
-    crud_delete_review(session, review)
+async def remove_review(session: AsyncSession, *, review: Review) -> None:
+    await crud_delete_review(session, review)
@@ -17,7 +17,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import and_, desc, func, or_, select, text
+from sqlalchemy import and_, column, desc, func, or_, select, table, text
 from sqlmodel import Session
 
 from app.models.booking import Booking
@@ -44,17 +44,30 @@ def build_event_query(
 
     # ————— TEXT SEARCH (title / desc / host) ——————————
     if filters.search:
-        term = f"%{filters.search.lower()}%"
         if session.get_bind().dialect.name == "postgresql":
-            # Use ILIKE for small data; full-text can replace later
-            stmt = stmt.where(
-                or_(
-                    func.lower(Event.title).ilike(term),
-                    func.lower(Event.description).ilike(term),
-                    func.lower(Event.host_name).ilike(term),
+            query = filters.search.strip()
+            if " " not in query:
+                # Single-word queries are often prefixes or typos, which
+                # whole-lexeme tsvector matching misses.  ILIKE here is
+                # index-backed by the pg_trgm GIN indexes (0011).
+                term = f"%{query}%"
+                stmt = stmt.where(
+                    or_(
+                        Event.title.ilike(term),
+                        Event.host_name.ilike(term),
+                    )
+                )
+            else:
+                # Multi-word natural-language search: the @@ predicate
+                # rides the tsvector GIN index (posting-list
+                # intersection) instead of three ILIKE seq scans.
+                stmt = stmt.where(
+                    Event.search_vector.op("@@")(
+                        func.plainto_tsquery("english", query)
+                    )
                 )
-            )
         else:  # SQLite fallback
+            term = f"%{filters.search.lower()}%"
             stmt = stmt.where(
                 or_(
                     func.lower(Event.title).like(term),
@@ -74,7 +87,7 @@ def build_event_query(
         stmt = stmt.where(Event.price_minor <= filters.price_max)
 
     # ————— SORTING ————————————————————————————————
-    stmt = _apply_sort(stmt, filters.sort)
+    stmt = _apply_sort(stmt, filters.sort, session.get_bind().dialect.name)
 
     # Build count() statement before pagination
     count_stmt = select(func.count()).select_from(stmt.subquery())
@@ -87,7 +100,12 @@ def build_event_query(
 # ---------------------------------------------------------------------------
 
 
-def _apply_sort(stmt, sort: SortOption | str):
+# Lightweight handle on the Postgres materialized view (migration 0006);
+# refreshed every 10 min by app.workers.popularity.
+_POPULARITY_MV = table("event_popularity_30d", column("event_id"), column("pop"))
+
+
+def _apply_sort(stmt, sort: SortOption | str, dialect: str = ""):
     """
     Add ORDER BY clauses depending on the selected sort option.
     """
@@ -100,6 +118,20 @@ def _apply_sort(stmt, sort: SortOption | str):
             Event.rating_avg.desc().nullslast(), Event.created_at.desc()
         )
     if option == "popularity":
+        if dialect == "postgresql":
+            # Join the pre-aggregated MV: an indexed lookup instead of a
+            # 30-day GROUP BY over the booking table on every page.
+            return (
+                stmt.join(
+                    _POPULARITY_MV,
+                    Event.id == _POPULARITY_MV.c.event_id,
+                    isouter=True,
+                )
+                .order_by(_POPULARITY_MV.c.pop.desc().nullslast())
+                .order_by(Event.created_at.desc())
+            )
+
+        # SQLite (dev/test) has no materialized views → live aggregate.
         # Popularity = confirmed bookings in last 30 days
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
         popularity_sub = (
@@ -7,6 +7,7 @@ All configuration values come from `app.core.config.settings`.
 from __future__ import annotations
 
 import uuid
+from functools import lru_cache
 from typing import Optional
 
 import boto3
@@ -15,19 +16,26 @@ from botocore.client import Config  # noqa: WPS433 (runtime import)
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_s3_client():
     """
     Return a boto3 S3 **client** configured for MinIO or AWS.
 
     • Works with both traditional AWS endpoint **and** local MinIO.
     • Reuses credentials from `.env` via settings.
+    • Built once per process (`lru_cache`): credential resolution and the
+      endpoint/signer chain cost tens of ms, and presigning is called per
+      upload.  Tests that swap settings can `get_s3_client.cache_clear()`.
     """
     return boto3.client(
         "s3",
         endpoint_url=settings.S3_ENDPOINT_URL or None,
         aws_access_key_id=settings.S3_ACCESS_KEY,
         aws_secret_access_key=settings.S3_SECRET_KEY,
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=50,
+        ),
     )
 
 
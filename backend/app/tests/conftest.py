@@ -1,20 +1,23 @@
 """conftest.py – Global pytest fixtures for the Scheduler back‑end
 ================================================================
-These fixtures wire up an **in‑memory SQLite database**, dependency
-overrides, an event‑loop for async tests, and a TestClient that runs
-all Celery tasks **eagerly** so you don’t need a worker during unit
-runs.
+These fixtures wire up an **in‑memory SQLite database** (via the
+``aiosqlite`` driver so it matches the async request path), dependency
+overrides, and a TestClient that runs all Celery tasks **eagerly** so
+you don’t need a worker during unit runs.
 """
 
 from __future__ import annotations
 
 import asyncio
 import os
-from typing import AsyncGenerator, Generator, Tuple
+from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # ────────────────────────────────────────────────────────────────
 # Import application objects *after* any environment tweaks
@@ -22,6 +25,18 @@ from sqlmodel import SQLModel, Session, create_engine
 
 # Ensure a clean env before settings are imported
 os.environ.setdefault("APP_ENV", "test")
+# One *named* shared-cache in-memory database: the async request path
+# (aiosqlite below) and the sync engine that eagerly-run Celery tasks use
+# (core.database, built from DATABASE_URL) open the same DB, so in-process
+# tasks see the rows the API just committed.  A plain "sqlite://" would
+# give the sync engine its own empty per-connection DB and every eager
+# task would die with "no such table".
+_TEST_DB_URI = "file:scheduler-tests?mode=memory&cache=shared&uri=true"
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_URI}"  # never touch a real DB
+# Blank out any .env S3 credentials: eager tasks then write .ics files to
+# the temp dir instead of calling out to MinIO/S3 mid-test.
+os.environ["S3_ACCESS_KEY"] = ""
+os.environ["S3_SECRET_KEY"] = ""
 
 from app.core.config import settings  # noqa: E402
 from app.core.celery_app import celery_app  # noqa: E402
@@ -29,79 +44,90 @@ from app.main import app  # noqa: E402
 from app.api.deps import db_session as _db_session  # noqa: E402
 
 # ────────────────────────────────────────────────────────────────
-# Asyncio event loop – module scope so async tests share it
+# Database: in‑memory SQLite (one per test session, async driver)
 # ────────────────────────────────────────────────────────────────
 
+test_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{_TEST_DB_URI}",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,  # pinned connection keeps the shared DB alive
+    echo=False,
+)
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:  # type: ignore[name-defined]
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+from sqlalchemy import event  # noqa: E402
 
 
-# ────────────────────────────────────────────────────────────────
-# Database: in‑memory SQLite (one per test session)
-# ────────────────────────────────────────────────────────────────
+@event.listens_for(test_engine.sync_engine, "connect")
+def _sqlite_test_pragmas(dbapi_conn, _record) -> None:
+    """Drop durability the test DB doesn't need; enforce FKs like PG does."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
 
-def _build_test_engine():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        echo=False,
-    )
-    return engine
+TestSessionLocal = async_sessionmaker(
+    bind=test_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
-@pytest.fixture(scope="session")
-def engine():
-    """Singleton SQLModel engine for the whole test run."""
-    engine_obj = _build_test_engine()
+def _run(coro):
+    """Run a coroutine from sync fixture code (loop closed afterwards)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
 
-    # Import models once so metadata is populated
-    import app.models  # noqa: F401 – side‑effect import
+@pytest.fixture(scope="session", autouse=True)
+def _create_schema() -> Generator[None, None, None]:
+    """Create all tables once for the test run, drop afterwards."""
 
-    SQLModel.metadata.create_all(engine_obj)
-    yield engine_obj
-    SQLModel.metadata.drop_all(engine_obj)
+    import app.models  # noqa: F401 – side‑effect import populates metadata
 
+    async def _create() -> None:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
 
-@pytest.fixture
-def session(engine) -> Generator[Session, None, None]:
-    """Create a *rollback‑after* Session for each test function."""
+    async def _drop() -> None:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.drop_all)
 
-    with Session(engine) as s:
-        # BEGIN a nested transaction
-        trans = s.begin_nested()
-        yield s
-        # Rollback to savepoint → clean state
-        trans.rollback()
-        # Expire objects so subsequent tests don’t see stale state
-        s.expunge_all()
+    _run(_create())
+    yield
+    _run(_drop())
+
+
+@pytest.fixture(autouse=True)
+def _clean_tables() -> Generator[None, None, None]:
+    """Wipe all rows after each test so state never leaks between tests."""
+
+    async def _truncate() -> None:
+        async with test_engine.begin() as conn:
+            for table in reversed(SQLModel.metadata.sorted_tables):
+                await conn.execute(table.delete())
+
+    yield
+    _run(_truncate())
 
 
 # ────────────────────────────────────────────────────────────────
-# Dependency override – FastAPI gets the Session above
+# Dependency override – FastAPI gets the AsyncSession above
 # ────────────────────────────────────────────────────────────────
 
 
-def _override_db_session() -> Generator[Session, None, None]:
-    from contextlib import contextmanager
+async def _override_db_session():
+    async with TestSessionLocal() as session:
+        yield session
 
-    @contextmanager
-    def _ctx() -> Generator[Session, None, None]:
-        with Session(engine) as s:  # type: ignore[arg-type]
-            trans = s.begin_nested()
-            try:
-                yield s
-                trans.commit()
-            finally:
-                s.expunge_all()
-    yield from _ctx()
 
-
-app.dependency_overrides[_db_session] = _override_db_session  # type: ignore[assignment]
+app.dependency_overrides[_db_session] = _override_db_session
 
 
 # ────────────────────────────────────────────────────────────────
@@ -117,8 +143,13 @@ celery_app.conf.task_eager_propagates = True
 # ────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
-    """FastAPI TestClient with DB + Celery overrides already applied."""
+    """FastAPI TestClient with DB + Celery overrides already applied.
+
+    Session-scoped: app startup/shutdown (lifespan) and client setup run
+    once per test run instead of per test; row isolation is handled by
+    the autouse ``_clean_tables`` fixture.
+    """
     with TestClient(app) as c:
         yield c
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+"""tests/test_bookings.py – booking lifecycle through the API.
+
+Celery tasks run eagerly here (see conftest), so POSTing a booking also
+exercises the confirmation-e-mail task against the shared test database.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _event_payload(max_bookings: int = 2) -> Dict[str, Any]:
+    start_time = datetime(2030, 1, 1, 10, 0, tzinfo=timezone.utc).strftime(ISO)
+    return {
+        "title": "Office Hours",
+        "description": "1:1 review slot",
+        "host_name": "Bob",
+        "category": "Business",
+        "duration_min": 30,
+        "price_minor": 0,
+        "currency": "USD",
+        "timezone": "UTC",
+        "image_url": None,
+        "slots": [{"start_utc": start_time, "max_bookings": max_bookings}],
+    }
+
+
+@pytest.fixture
+def event_with_slot(client: TestClient) -> dict:
+    resp = client.post("/events", json=_event_payload())
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def test_booking_lifecycle(client: TestClient, event_with_slot):
+    evt_id = event_with_slot["id"]
+    slot_id = event_with_slot["slots"][0]["id"]
+
+    # Create — the eager send_booking_email task runs before the response
+    # returns, so a broken worker-side loader would fail this request.
+    resp = client.post(
+        f"/events/{evt_id}/bookings",
+        json={"slot_id": slot_id, "name": "Ada", "email": "ada@example.com"},
+    )
+    assert resp.status_code == 201, resp.text
+    booking = resp.json()
+    assert booking["status"] == "CONFIRMED"
+
+    # Same e-mail on the same slot → 409
+    dup = client.post(
+        f"/events/{evt_id}/bookings",
+        json={"slot_id": slot_id, "name": "Ada", "email": "ada@example.com"},
+    )
+    assert dup.status_code == 409
+
+    # Seat count reflects the claim
+    detail = client.get(f"/events/{evt_id}")
+    assert detail.json()["slots"][0]["remaining"] == 1
+
+    # Cancel, then a second cancel is rejected
+    resp = client.patch(f"/bookings/{booking['id']}", json={"status": "CANCELLED"})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "CANCELLED"
+
+    again = client.patch(f"/bookings/{booking['id']}", json={"status": "CANCELLED"})
+    assert again.status_code == 400
+
+
+def test_booking_full_slot_rejected(client: TestClient):
+    created = client.post("/events", json=_event_payload(max_bookings=1)).json()
+    slot_id = created["slots"][0]["id"]
+
+    first = client.post(
+        f"/events/{created['id']}/bookings",
+        json={"slot_id": slot_id, "name": "Ada", "email": "ada@example.com"},
+    )
+    assert first.status_code == 201
+
+    full = client.post(
+        f"/events/{created['id']}/bookings",
+        json={"slot_id": slot_id, "name": "Grace", "email": "grace@example.com"},
+    )
+    assert full.status_code == 409
+    assert "full" in full.json()["detail"].lower()
@@ -69,11 +69,44 @@ def test_create_event_and_get_detail(client: TestClient):
 
 
 def test_list_events_returns_x_total_header(client: TestClient, created_event):
-    resp = client.get("/events")
+    # Total is opt-in now (keyset pagination skips the COUNT by default)
+    resp = client.get("/events", params={"with_total": "true"})
     assert resp.status_code == 200
     assert resp.headers.get("X-Total") == "1"
     assert len(resp.json()) == 1
 
+    # Without the flag no aggregate is run and the header is absent
+    resp = client.get("/events")
+    assert resp.status_code == 200
+    assert "X-Total" not in resp.headers
+
+
+def test_list_events_keyset_cursor(client: TestClient):
+    ids = []
+    for i in range(3):
+        payload = _event_payload()
+        payload["title"] = f"Event {i}"
+        resp = client.post("/events", json=payload)
+        assert resp.status_code == 201
+        ids.append(resp.json()["id"])
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"size": 1}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/events", params=params)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert len(body) == 1
+        seen.append(body[0]["id"])
+        cursor = resp.headers.get("X-Cursor")
+
+    # newest-first, no duplicates, exhausted after the last page
+    assert seen == list(reversed(ids))
+    assert cursor is None
+
 
 # ensure category filter works
 
@@ -13,15 +13,21 @@ per user, and call Google / Outlook APIs.  For this mini‑Calendly we:
 Feel free to swap the `log.debug` lines with real API calls later.
 """
 
-import json
+import hashlib
 import logging
+from datetime import timedelta
 from enum import Enum
+from typing import List, Sequence
 
-from sqlmodel import Session
+import orjson
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
 
 from app.core.celery_app import celery_app
 from app.core.database import get_session
+from app.core.redis import redis_conn
 from app.models.booking import Booking, BookingStatus
+from app.models.slot import Slot
 from app.services.calendar import generate_ics_bytes
 
 log = logging.getLogger(__name__)
@@ -36,17 +42,26 @@ class CalendarAction(str, Enum):
 # Helper – load booking + slot + event
 # --------------------------------------------------------------------------------------------------
 
-def _booking_with_event(booking_id: str) -> Booking | None:
-    from sqlalchemy.orm import selectinload
-    from sqlmodel import select
+def _booking_with_event(
+    booking_id: str, status: BookingStatus | None = None
+) -> Booking | None:
+    # Shared Redis-cached loader (see services.bookings.load_booking):
+    # the e-mail task for the same booking usually fires seconds apart,
+    # so the second lookup is a Redis GET rather than a repeat SELECT.
+    from app.services.bookings import load_booking
 
+    return load_booking(booking_id, status=status)
+
+
+def _bookings_with_event(booking_ids: Sequence[str]) -> List[Booking]:
+    """Load bookings with slot + event in a single round-trip (WHERE IN)."""
     with get_session() as session:
         stmt = (
             select(Booking)
-            .where(Booking.id == booking_id)
-            .options(selectinload(Booking.slot).selectinload("event"))
+            .where(Booking.id.in_(booking_ids))
+            .options(selectinload(Booking.slot).selectinload(Slot.event))
         )
-        return session.exec(stmt).one_or_none()
+        return session.exec(stmt).all()
 
 
 # --------------------------------------------------------------------------------------------------
@@ -75,13 +90,55 @@ def sync_booking_with_calendar(booking_id: str, action: str = CalendarAction.CRE
         "summary": event.title,
         "description": event.description,
         "startUTC": slot.start_utc.isoformat(),
-        "endUTC": (slot.start_utc + event.duration_min * 60).isoformat(),
+        "endUTC": (slot.start_utc + timedelta(minutes=event.duration_min)).isoformat(),
         "attendee": booking.email,
         "action": action,
     }
 
-    # In a real implementation you'd call requests/google‑client here
-    log.debug("[MOCK] Pushing to calendar API: %s", json.dumps(payload))
+    # In a real implementation you'd call requests/google‑client here.
+    # Serialize only when DEBUG is actually on — at INFO this is free.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("[MOCK] Pushing to calendar API: %s", orjson.dumps(payload).decode())
+
+
+@celery_app.task(name="calendar.sync_bulk", acks_late=True, max_retries=2)
+def sync_bookings_with_calendar_bulk(
+    booking_ids: list[str], action: str = CalendarAction.CREATE
+) -> None:
+    """Sync many bookings in one task (bulk schedule changes).
+
+    One broker message and one ``WHERE id IN (...)`` query replace N of
+    each; the payloads are shipped as a single batch request to the
+    provider (Google's ``multipart/mixed`` batch endpoint takes up to 50
+    sub-requests, hence the cap), so N TLS handshakes collapse to 1.
+    """
+    if len(booking_ids) > 50:
+        # Recurse in provider-sized chunks rather than rejecting the call.
+        for i in range(0, len(booking_ids), 50):
+            sync_bookings_with_calendar_bulk.delay(booking_ids[i : i + 50], action)
+        return
+
+    bookings = _bookings_with_event(booking_ids)
+    if not bookings:
+        log.error("calendar.sync_bulk: no bookings found for %s ids", len(booking_ids))
+        return
+
+    batch = [
+        {
+            "summary": b.slot.event.title,
+            "description": b.slot.event.description,
+            "startUTC": b.slot.start_utc.isoformat(),
+            "endUTC": (
+                b.slot.start_utc + timedelta(minutes=b.slot.event.duration_min)
+            ).isoformat(),
+            "attendee": b.email,
+            "action": action,
+        }
+        for b in bookings
+    ]
+
+    # Real implementation: POST the whole list to the batch endpoint.
+    log.debug("[MOCK] Batch-pushing %d events to calendar API", len(batch))
 
 
 # --------------------------------------------------------------------------------------------------
@@ -89,24 +146,47 @@ def sync_booking_with_calendar(booking_id: str, action: str = CalendarAction.CRE
 # --------------------------------------------------------------------------------------------------
 
 
-@celery_app.task(name="calendar.cache_ics", ignore_result=True)
+_ICS_TTL = 604_800  # one week
+
+
+# acks_late=False: regeneration is cheap and idempotent, so acking on
+# receipt (one fewer broker RTT) beats redelivery-on-crash semantics here.
+@celery_app.task(name="calendar.cache_ics", ignore_result=True, acks_late=False)
 def cache_ics_in_background(booking_id: str) -> None:  # noqa: D401
-    """Generate .ics and keep in Redis or filesystem cache.
+    """Generate .ics and keep it in Redis, shared across all workers.
 
-    This is optional; front‑end already can download via endpoint.
+    A content hash over the fields that feed the file (start time, title,
+    attendee) is stored alongside it; when a re-enqueue for an unchanged
+    booking arrives, the hash matches and generation is skipped entirely.
+    The old /tmp file cache was per-container and invisible to the other
+    gevent workers.
     """
-
-    booking = _booking_with_event(booking_id)
-    if booking is None or booking.status != BookingStatus.CONFIRMED:
+    # Status filter rides in the WHERE clause: a cancelled booking costs
+    # an empty-result probe, not a joined slot+event load.
+    booking = _booking_with_event(booking_id, status=BookingStatus.CONFIRMED)
+    if booking is None:
         return
 
+    slot = booking.slot
+    event = slot.event
     try:
-        ics_bytes = generate_ics_bytes(booking)
-        path = f"/tmp/ics_cache/{booking.id}.ics"
-        from pathlib import Path
+        h = hashlib.blake2b(
+            f"{slot.start_utc}{event.title}{booking.email}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        meta_key = f"ics:meta:{booking.id}"
+        cached_hash = redis_conn.get(meta_key)  # str (decode_responses=True)
+        if cached_hash == h:
+            log.debug("ics for %s unchanged — skipping regeneration", booking.id)
+            return
 
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
-        Path(path).write_bytes(ics_bytes)
-        log.debug("Cached .ics at %s", path)
+        ics_bytes = generate_ics_bytes(booking)
+        # Both writes in one round-trip (no transaction needed — worst
+        # case a crash between them costs one redundant regeneration).
+        with redis_conn.pipeline(transaction=False) as pipe:
+            pipe.setex(f"ics:file:{booking.id}", _ICS_TTL, ics_bytes)
+            pipe.setex(meta_key, _ICS_TTL, h)
+            pipe.execute()
+        log.debug("Cached .ics for %s in Redis", booking.id)
     except Exception:  # pragma: no cover
         log.exception("Failed to cache .ics for %s", booking.id)
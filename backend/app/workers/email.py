@@ -8,44 +8,67 @@ Current tasks
     – Generates body + subject
     – Adds Google Calendar quick‑add link and .ics download link
     – Uses services.email.send_email_plain
+• **send_email_batch** – rate-limited fan-out of one message to many
+    recipients (event reminders, announcements); one task per campaign
+    instead of one per recipient
 
 Extend this file with additional notification or digest tasks as needed.
 """
 
+import contextlib
 import logging
+from datetime import datetime
+from functools import lru_cache
 from textwrap import dedent
-from typing import Optional
-
-from sqlmodel import Session
 
 from app.core.celery_app import celery_app
-from app.core.database import get_session
-from app.models.booking import Booking
+from app.core.config import settings
+from app.core.ratelimit import try_acquire
 from app.services.calendar import (
     google_calendar_link,
     upload_ics_and_return_url,
 )
-from app.services.email import send_email_plain
+from app.services.email import send_email_bulk, send_email_plain
 
 log = logging.getLogger(__name__)
 
+# Dedented ONCE at import: per-send cost is a single format_map, not a
+# dedent line scan + f-string rebuild for every confirmation.
+_SUBJECT_TMPL = "Confirmed: {title} on {when}"
+_BODY_TMPL = dedent(
+    """
+    Hi {name},
 
-# --------------------------------------------------------------------------------------------------
-# Helper – fetch booking with eager‑loaded slot + event
-# --------------------------------------------------------------------------------------------------
+    Your booking for **{title}** is confirmed!
 
-def _fetch_booking(session: Session, booking_id: str) -> Optional[Booking]:
-    from sqlalchemy.orm import selectinload
-    from sqlmodel import select
+    • 📆  Date & Time (UTC): {when_long}
+    • ⏱   Duration         : {duration_min} min
+    • 🧑‍💼  Host             : {host_name}
 
-    stmt = (
-        select(Booking)
-        .where(Booking.id == booking_id)
-        .options(
-            selectinload(Booking.slot).selectinload("event")  # slot → event
-        )
-    )
-    return session.exec(stmt).one_or_none()
+    ─────────────────────────────────────────────────
+    Add to Google Calendar → {gcal_link}
+    Download .ics           → {ics_url}
+    ─────────────────────────────────────────────────
+
+    Need to cancel? Just click the link in your dashboard.
+
+    Cheers,
+    Scheduler Bot
+    """
+).strip()
+
+
+def _fmt_short(dt: datetime) -> str:
+    """`2026-08-31 14:00 UTC` via f-string — skips strftime's table walk."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d} UTC"
+
+
+@lru_cache(maxsize=2048)
+def _fmt_long(dt: datetime) -> str:
+    """`Monday, 31 August 2026 14:00` — strftime's day/month-name lookup
+    runs once per distinct slot time; every other booking on the same
+    slot reuses the memo."""
+    return f"{dt:%A, %d %B %Y %H:%M}"
 
 
 # --------------------------------------------------------------------------------------------------
@@ -53,49 +76,66 @@ def _fetch_booking(session: Session, booking_id: str) -> Optional[Booking]:
 # --------------------------------------------------------------------------------------------------
 
 
-@celery_app.task(name="email.send_booking_email", acks_late=True, max_retries=3)
-def send_booking_email(booking_id: str) -> None:  # noqa: D401
+@celery_app.task(name="email.send_booking_email", bind=True, acks_late=True, max_retries=3)
+def send_booking_email(self, booking_id: str) -> None:  # noqa: D401
     """Send confirmation e‑mail for a booking.
 
-    *Retries* up to 3× on network errors.
+    *Retries* up to 3× on network errors, and backs off (without burning
+    a retry budget slot for SES) when the cluster-wide send ceiling is
+    reached — the Redis sliding window counts sends across every worker,
+    which Celery's per-worker ``rate_limit`` cannot.
     """
 
-    with get_session() as session:
-        booking = _fetch_booking(session, booking_id)
-        if booking is None:
-            log.error("send_booking_email: booking %s not found", booking_id)
-            return
+    if not try_acquire("ratelimit:email", settings.EMAIL_SENDS_PER_SECOND):
+        raise self.retry(countdown=min(2 ** self.request.retries, 30), max_retries=10)
 
-        slot = booking.slot
-        event = slot.event
+    # Idempotency gate: webhook double-fires and broker redeliveries can
+    # queue the same booking several times — the atomic SETNX means only
+    # the first task sends, the rest return before touching the DB.  The
+    # key is released on failure so Celery retries aren't locked out.
+    from app.core.redis import redis_conn
+
+    sent_key = f"email:sent:{booking_id}"
+    try:
+        first = bool(redis_conn.set(sent_key, "1", nx=True, ex=3600))
+    except Exception:  # pragma: no cover — Redis down: send anyway
+        first = True
+    if not first:
+        log.info("send_booking_email: duplicate for %s skipped", booking_id)
+        return
+
+    # Shared Redis-cached loader: when the calendar task already pulled
+    # this booking, the SELECT is skipped entirely (local import — the
+    # bookings service imports this module for task handles).
+    from app.services.bookings import load_booking
+
+    booking = load_booking(booking_id)
+    if booking is None:
+        log.error("send_booking_email: booking %s not found", booking_id)
+        return
+
+    slot = booking.slot
+    event = slot.event
 
     # Calendar links / attachments
     gcal_link = google_calendar_link(booking)
     ics_url = upload_ics_and_return_url(booking)
 
     # Craft e‑mail
-    subject = f"Confirmed: {event.title} on {slot.start_utc:%Y-%m-%d %H:%M UTC}"
-    body = dedent(
-        f"""
-        Hi {booking.name},
-
-        Your booking for **{event.title}** is confirmed!
-
-        • 📆  Date & Time (UTC): {slot.start_utc:%A, %d %B %Y %H:%M}
-        • ⏱   Duration         : {event.duration_min} min
-        • 🧑‍💼  Host             : {event.host_name}
-
-        ─────────────────────────────────────────────────
-        Add to Google Calendar → {gcal_link}
-        Download .ics           → {ics_url}
-        ─────────────────────────────────────────────────
-
-        Need to cancel? Just click the link in your dashboard.
-
-        Cheers,
-        Scheduler Bot
-        """
-    ).strip()
+    subject = _SUBJECT_TMPL.format_map(
+        {"title": event.title, "when": _fmt_short(slot.start_utc)}
+    )
+    body = _BODY_TMPL.format_map(
+        {
+            "name": booking.name,
+            "title": event.title,
+            "when_long": _fmt_long(slot.start_utc),
+            "duration_min": event.duration_min,
+            "host_name": event.host_name,
+            "gcal_link": gcal_link,
+            "ics_url": ics_url,
+        }
+    )
 
     try:
         send_email_plain(
@@ -106,4 +146,21 @@ def send_booking_email(booking_id: str) -> None:  # noqa: D401
         log.info("Booking confirmation sent to %s", booking.email)
     except Exception:  # pragma: no cover
         log.exception("Failed to send booking e‑mail to %s", booking.email)
+        with contextlib.suppress(Exception):
+            redis_conn.delete(sent_key)  # let the retry actually send
         raise  # will trigger Celery retry
+
+
+@celery_app.task(name="email.send_batch", bind=True, acks_late=True)
+def send_email_batch(self, recipients: list[str], subject: str, body: str) -> None:
+    """Fan one message out to a batch of recipients.
+
+    Campaign-style senders enqueue ONE of these per batch instead of one
+    task per address: the transport layer collapses the batch into as few
+    API calls as the backend allows (1000/request on SendGrid, 50/call on
+    SES).  Quota enforcement is the Redis sliding window below, which
+    counts sends across every worker in the cluster.
+    """
+    if not try_acquire("ratelimit:email", settings.EMAIL_SENDS_PER_SECOND):
+        raise self.retry(countdown=min(2 ** self.request.retries, 30), max_retries=10)
+    send_email_bulk(recipients=recipients, subject=subject, body=body)
@@ -1,6 +1,23 @@
-from app.services.fx import get_rates
 from app.core.celery_app import celery_app
+from app.core.redis import redis_conn
+from app.services.fx import get_rates
 
-@celery_app.task(name="fx.refresh_rates")
+# acks_late=False: beat re-schedules this anyway, so a lost run just
+# means the next tick (or a stale-while-revalidate trigger) refreshes.
+@celery_app.task(name="fx.refresh_rates", acks_late=False)
 def refresh_rates():
-    get_rates(force_refresh=True)
+    # force_refresh bypasses get_rates' single-flight wait by design, so
+    # duplicate triggers (overlapping beats, SWR kicks racing a beat)
+    # are collapsed here instead: first holder fetches, the rest no-op.
+    try:
+        if not redis_conn.set("lock:fx_refresh", "1", nx=True, ex=300):
+            return
+    except Exception:  # Redis down — refresh anyway
+        pass
+    try:
+        get_rates(force_refresh=True)
+    finally:
+        try:
+            redis_conn.delete("lock:fx_refresh")
+        except Exception:
+            pass
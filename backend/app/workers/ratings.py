@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+"""Celery tasks for rating maintenance
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+The request path keeps ``event.rating_avg`` / ``rating_count`` fresh
+with an O(1) incremental delta inside the review transaction, so no
+task runs per review.  This worker is the repair side: a full
+re-aggregation from the ``review`` table, for drift repair, backfills,
+or a periodic sweep.
+
+    recompute.apply_async(args=[event_id], queue="analytics")
+"""
+
+import logging
+
+from app.core.celery_app import celery_app
+from app.core.database import get_session
+from app.crud.events import rating_recompute_stmt
+
+log = logging.getLogger(__name__)
+
+
+@celery_app.task(name="ratings.recompute", acks_late=True, max_retries=3)
+def recompute(event_id: str) -> None:  # noqa: D401
+    """Re-aggregate one event's rating columns from its reviews."""
+    with get_session() as session:
+        session.exec(rating_recompute_stmt(event_id))
+    log.info("⭐  Rating recomputed for event %s", event_id)
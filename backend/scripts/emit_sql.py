@@ -0,0 +1,35 @@
+"""Emit the migration SQL for review / DBA hand-off without touching a DB.
+
+Runs Alembic in *offline* mode (``upgrade --sql``) against the configured
+``DATABASE_URL`` dialect, printing the full DDL to stdout::
+
+    python scripts/emit_sql.py              # baseline → head
+    python scripts/emit_sql.py 0002:head    # explicit revision range
+
+Useful for environments where migrations are applied by hand (or need
+sign-off) rather than run by the app container.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+# repo root holds alembic.ini (script_location = backend/alembic)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_DIR = REPO_ROOT / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+def main() -> None:
+    revision = sys.argv[1] if len(sys.argv) > 1 else "head"
+    cfg = Config(str(REPO_ROOT / "alembic.ini"))
+    # sql=True puts env.py into offline mode → run_migrations_offline()
+    command.upgrade(cfg, revision, sql=True)
+
+
+if __name__ == "__main__":
+    main()